@@ -4,15 +4,27 @@ Flask Web Application for Claude Life Brand Analysis
 """
 
 import sys
+import copy
 import json
+import re
+import gzip
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
 import threading
 import time
 import os
+from functools import lru_cache
+from flask.json.provider import DefaultJSONProvider
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+try:
+    import orjson
+except ImportError:  # Optional: fall back to Flask's stdlib JSON provider
+    orjson = None
+
+# Add src to path, first so project modules win over same-named packages
+SRC_DIR = str(Path(__file__).parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 # Import config module which automatically loads environment variables (same as CLI)
 # This ensures identical environment loading to the CLI
@@ -21,62 +33,184 @@ from brand_workflow_orchestrator import BrandWorkflowOrchestrator
 from ai_providers.ai_factory import AIProviderFactory
 from config import config
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, for the large /status payloads."""
+
+    def dumps(self, obj, **kwargs):
+        # Hand datetimes to Flask's default so they keep the HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 app.secret_key = 'claude-life-secret-key-2025'
+# static/ serves unversioned pages, so keep the cache short: browsers reuse
+# them briefly, then revalidate with the ETag and pick up a redeploy quickly
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 300
 
 # Global variable to store workflow results
 workflow_results = {}
 
+# Sessions kept for the results and status pages; past this many, the oldest
+# finished session is dropped to make room for a new one
+WORKFLOW_RESULTS_MAX_ENTRIES = 256
+_workflow_results_lock = threading.Lock()
+
+def store_workflow_result(session_id: str, results: dict) -> None:
+    """Record a session's results, evicting the oldest finished session when full."""
+    with _workflow_results_lock:
+        if session_id not in workflow_results and len(workflow_results) >= WORKFLOW_RESULTS_MAX_ENTRIES:
+            for old_id, old_results in workflow_results.items():
+                if old_results.get('workflow_status') != 'in_progress':
+                    del workflow_results[old_id]
+                    break
+        workflow_results[session_id] = results
+
+# Completed workflows keyed by (url, provider choices), reused for a short
+# window so repeat analyses of the same site skip the whole pipeline
+RESULT_CACHE_TTL = 600
+RESULT_CACHE_MAX_ENTRIES = 128
+_result_cache = {}
+_result_cache_lock = threading.Lock()
+
+def get_cached_result(key: tuple):
+    """Return a cached completed workflow result, or None if absent or expired."""
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > RESULT_CACHE_TTL:
+            del _result_cache[key]
+            return None
+        return results
+
+def cache_result(key: tuple, results: dict) -> None:
+    """Store a completed workflow result, evicting the oldest entry when full."""
+    with _result_cache_lock:
+        if key not in _result_cache and len(_result_cache) >= RESULT_CACHE_MAX_ENTRIES:
+            del _result_cache[next(iter(_result_cache))]
+        _result_cache[key] = (time.monotonic(), results)
+
+# Session IDs are derived from the URL: scheme stripped, separators dashed
+_SESSION_SCHEME_RE = re.compile(r'^https?://')
+_SESSION_TRANS = str.maketrans({'/': '-', '.': '-'})
+
+# Capabilities selectable on the index form (posted as "<capability>_provider")
+PROVIDER_CAPABILITIES = ('text_analysis', 'text_generation', 'web_analysis', 'content_strategy')
+
+# Providers that can serve the text capabilities offered on the index form
+TEXT_CAPABLE_PROVIDERS = ("claude", "openai", "gemini")
+
+@lru_cache(maxsize=1)
+def get_provider_status() -> dict:
+    """Return availability and capabilities for every provider.
+
+    API keys are read from the environment once at startup, so the result is
+    computed on first use and shared by the index page and /providers.
+    """
+    available = AIProviderFactory.list_available_providers()
+    configured = config.get_available_providers()
+
+    result = {}
+    for provider, status in available.items():
+        if status.get("available") and configured.get(provider, False):
+            result[provider] = {
+                'available': True,
+                'capabilities': status.get('capabilities', [])
+            }
+        else:
+            result[provider] = {'available': False}
+
+    return result
+
+@lru_cache(maxsize=1)
+def get_text_providers() -> tuple:
+    """Return the configured text-capable providers."""
+    return tuple(
+        provider for provider, status in get_provider_status().items()
+        if status['available'] and provider in TEXT_CAPABLE_PROVIDERS
+    )
+
+# Warm the provider caches at startup so the first page view doesn't pay for
+# instantiating every provider class
+get_text_providers()
+
+# Responses worth compressing: rendered pages and JSON status payloads
+GZIP_MIMETYPES = {'text/html', 'application/json'}
+GZIP_MIN_SIZE = 1024
+
+@app.after_request
+def compress_response(response):
+    """Gzip HTML and JSON bodies for clients that accept it."""
+    if (response.direct_passthrough
+            or response.status_code != 200
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in GZIP_MIMETYPES
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
 def index():
     """Main page with form for URL input and AI model selection."""
-    # Get available providers
-    available_providers = AIProviderFactory.list_available_providers()
-    configured_providers = config.get_available_providers()
-    
-    # Filter to only show configured providers
-    text_providers = []
-    for provider, status in available_providers.items():
-        if status.get("available") and configured_providers.get(provider, False):
-            if provider in ["claude", "openai", "gemini"]:  # Text capable providers
-                text_providers.append(provider)
-    
-    return render_template('index.html', text_providers=text_providers)
+    return render_template('index.html', text_providers=get_text_providers())
 
 @app.route('/analyze', methods=['POST'])
 def analyze():
     """Handle URL analysis with selected AI providers."""
     url = request.form.get('url')
-    text_analysis_provider = request.form.get('text_analysis_provider', 'claude')
-    text_generation_provider = request.form.get('text_generation_provider', 'claude')
-    web_analysis_provider = request.form.get('web_analysis_provider', 'claude')
-    content_strategy_provider = request.form.get('content_strategy_provider', 'claude')
+    form = request.form
+    ai_providers = {
+        capability: form.get(f'{capability}_provider', 'claude')
+        for capability in PROVIDER_CAPABILITIES
+    }
     
     if not url:
         flash('Please enter a valid URL', 'error')
         return redirect(url_for('index'))
     
-    # Set environment variables for this request
-    os.environ['AI_TEXT_ANALYSIS_PROVIDER'] = text_analysis_provider
-    os.environ['AI_TEXT_GENERATION_PROVIDER'] = text_generation_provider
-    os.environ['AI_WEB_ANALYSIS_PROVIDER'] = web_analysis_provider
-    os.environ['AI_CONTENT_STRATEGY_PROVIDER'] = content_strategy_provider
-    
     # Generate a unique session ID for this analysis
-    session_id = f"{url.replace('https://', '').replace('http://', '').replace('/', '-').replace('.', '-')}-{int(time.time())}"
+    session_id = f"{_SESSION_SCHEME_RE.sub('', url).translate(_SESSION_TRANS)}-{int(time.time())}"
+    
+    # Serve a recent identical analysis without re-running the workflow
+    cache_key = (url, tuple(sorted(ai_providers.items())))
+    cached = get_cached_result(cache_key)
+    if cached is not None:
+        # Each session gets its own copy so nothing it touches leaks into the cache
+        store_workflow_result(session_id, copy.deepcopy(cached))
+        return redirect(url_for('results', session_id=session_id))
     
     # Start workflow in background thread
     def run_workflow():
         try:
-            orchestrator = BrandWorkflowOrchestrator()
+            # Providers are passed per request rather than through os.environ,
+            # which is shared by every concurrent workflow thread
+            orchestrator = BrandWorkflowOrchestrator(ai_providers)
             results = orchestrator.run_complete_workflow(url)
-            workflow_results[session_id] = results
+            store_workflow_result(session_id, results)
+            if results.get('workflow_status') == 'completed':
+                cache_result(cache_key, copy.deepcopy(results))
         except Exception as e:
-            print(f"Workflow error: {e}")
-            workflow_results[session_id] = {'error': str(e), 'workflow_status': 'failed'}
+            app.logger.exception("Workflow error for %s", url)
+            store_workflow_result(session_id, {'error': str(e), 'workflow_status': 'failed'})
     
     # Start the workflow
-    workflow_results[session_id] = {'workflow_status': 'in_progress'}
+    store_workflow_result(session_id, {'workflow_status': 'in_progress'})
     thread = threading.Thread(target=run_workflow)
     thread.daemon = True
     thread.start()
@@ -86,12 +220,12 @@ def analyze():
 @app.route('/results/<session_id>')
 def results(session_id):
     """Display results page for a specific analysis session."""
-    if session_id not in workflow_results:
+    # Sessions can be evicted at any time, so look up once rather than test then index
+    results = workflow_results.get(session_id)
+    if results is None:
         flash('Analysis session not found', 'error')
         return redirect(url_for('index'))
     
-    results = workflow_results[session_id]
-    
     # If still in progress, show loading page
     if results['workflow_status'] == 'in_progress':
         return render_template('loading.html', session_id=session_id)
@@ -121,10 +255,9 @@ def results(session_id):
 @app.route('/status/<session_id>')
 def status(session_id):
     """API endpoint to check workflow status."""
-    if session_id not in workflow_results:
+    results = workflow_results.get(session_id)
+    if results is None:
         return jsonify({'error': 'Session not found'}), 404
-    
-    results = workflow_results[session_id]
     return jsonify({
         'status': results.get('workflow_status', 'unknown'),
         'phases': results.get('phases', {}),
@@ -147,44 +280,20 @@ def download_image(filepath):
         if not str(full_path.resolve()).startswith(str(base_dir / 'metrics')):
             return "Access denied", 403
 
-        # Debug info for troubleshooting
-        if not full_path.exists():
-            # List available files for debugging
-            metrics_dir = base_dir / 'metrics'
-            if metrics_dir.exists():
-                available_files = []
-                for f in metrics_dir.rglob('*'):
-                    if f.is_file():
-                        available_files.append(str(f.relative_to(base_dir)))
-                return f"File not found: {filepath}. Available files: {available_files[:10]}", 404
-            else:
-                return f"Metrics directory not found at: {metrics_dir}", 404
-
-        if full_path.is_file():
-            return send_file(full_path, as_attachment=True)
-        else:
-            return f"Path exists but is not a file: {full_path}", 404
+        if not full_path.is_file():
+            return "File not found", 404
+
+        # Generated images can be regenerated in place, so never cache them
+        return send_file(full_path, as_attachment=True, max_age=0)
 
-    except Exception as e:
-        return f"Error downloading file: {str(e)}", 500
+    except Exception:
+        app.logger.exception("Error downloading %s", filepath)
+        return "Error downloading file", 500
 
 @app.route('/providers')
 def providers():
     """API endpoint to get available providers."""
-    available = AIProviderFactory.list_available_providers()
-    configured = config.get_available_providers()
-    
-    result = {}
-    for provider, status in available.items():
-        if status.get("available") and configured.get(provider, False):
-            result[provider] = {
-                'available': True,
-                'capabilities': status.get('capabilities', [])
-            }
-        else:
-            result[provider] = {'available': False}
-    
-    return jsonify(result)
+    return jsonify(get_provider_status())
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5001))
@@ -6,10 +6,11 @@ Claude Life CLI - Command line interface with AI provider management
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.append(str(Path(__file__).parent / "src"))
+# Add src to path, first so project modules win over same-named packages
+SRC_DIR = str(Path(__file__).parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
-from brand_workflow_orchestrator import BrandWorkflowOrchestrator
 from ai_providers.ai_factory import AIProviderFactory
 from config import config
 
@@ -113,6 +114,8 @@ AI Provider Configuration:
     print("-" * 60)
     
     try:
+        # Imported here so --help/--providers skip loading every agent (bs4, PIL, ...)
+        from brand_workflow_orchestrator import BrandWorkflowOrchestrator
         orchestrator = BrandWorkflowOrchestrator()
         
         if args.agent == "complete":
@@ -10,9 +10,9 @@ import sys
 from pathlib import Path
 
 # Add src to path so we can import our modules
-sys.path.append(str(Path(__file__).parent / "src"))
-
-from brand_workflow_orchestrator import BrandWorkflowOrchestrator
+SRC_DIR = str(Path(__file__).parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 def main():
     """Main entry point."""
@@ -63,6 +63,8 @@ Available agents:
     print("-" * 60)
     
     try:
+        # Imported here so --help and argument errors skip loading every agent
+        from brand_workflow_orchestrator import BrandWorkflowOrchestrator
         orchestrator = BrandWorkflowOrchestrator()
         
         if args.agent == "complete":
@@ -13,4 +13,5 @@ echo "=================================="
 
 # Activate virtual environment and start the Flask app
 source venv/bin/activate
+export PYTHONPATH="$(cd "$(dirname "$0")" && pwd)/src${PYTHONPATH:+:$PYTHONPATH}"
 python app.py
\ No newline at end of file
@@ -1,12 +1,27 @@
 """Base agent class for all Claude Life agents."""
 
-import os
+import re
 import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Dict, Any, Optional
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import config  # noqa: F401  (importing config loads .env once per process)
+from prompt_loader import read_prompt
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+# Host part of a URL without scheme or leading "www.", for input urlsplit
+# rejects (e.g. an unclosed "[" IPv6 bracket), and the dot-to-dash map used
+# to turn a host into a filename-safe domain
+_DOMAIN_RE = re.compile(r'^(?:https?://)?(?:www\.)?([^/]*)')
+_DOT_TO_DASH = str.maketrans('.', '-')
 
 class BaseAgent(ABC):
     """Base class for all agents in the Claude Life system."""
@@ -15,7 +30,7 @@ class BaseAgent(ABC):
         self.name = name
         self.output_dir = Path(output_dir)
         self.logger = self._setup_logger()
-        self._load_environment()
+        self._created_dirs = set()
     
     def _setup_logger(self) -> logging.Logger:
         """Set up logging for the agent."""
@@ -32,16 +47,11 @@ class BaseAgent(ABC):
         
         return logger
     
-    def _load_environment(self) -> None:
-        """Load environment variables from .env file."""
-        env_file = Path('.env')
-        if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
+    def ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) unless this agent already did."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
     
     def save_json(self, data: Dict[Any, Any], filename: str, subdir: str = "") -> str:
         """Save data as JSON file."""
@@ -49,25 +59,30 @@ class BaseAgent(ABC):
         if subdir:
             output_path = output_path / subdir
         
-        output_path.mkdir(parents=True, exist_ok=True)
+        self.ensure_dir(output_path)
         
         filepath = output_path / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
         
-        self.logger.info(f"Saved {filename} to {filepath}")
+        self.logger.info("Saved %s to %s", filename, filepath)
         return str(filepath)
     
     def load_json(self, filepath: str) -> Optional[Dict[Any, Any]]:
         """Load JSON data from file."""
         try:
+            if orjson is not None:
+                return orjson.loads(Path(filepath).read_bytes())
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
-            self.logger.error(f"File not found: {filepath}")
+            self.logger.error("File not found: %s", filepath)
             return None
         except json.JSONDecodeError as e:
-            self.logger.error(f"JSON decode error in {filepath}: {e}")
+            self.logger.error("JSON decode error in %s: %s", filepath, e)
             return None
     
     def get_timestamp(self) -> str:
@@ -76,9 +91,18 @@ class BaseAgent(ABC):
     
     def sanitize_domain(self, url: str) -> str:
         """Extract and sanitize domain name from URL."""
-        domain = url.replace('https://', '').replace('http://', '')
-        domain = domain.replace('www.', '').split('/')[0]
-        return domain.replace('.', '-')
+        # urlsplit handles any scheme case, ports, userinfo and IPv6 hosts;
+        # bare domains ("example.com/about") get a "//" so they parse as hosts
+        has_netloc = '://' in url or url.startswith('//')
+        try:
+            host = urlsplit(url if has_netloc else f"//{url}").hostname
+        except ValueError:
+            host = None
+        if not host:
+            return _DOMAIN_RE.match(url).group(1).translate(_DOT_TO_DASH)
+        if host.startswith('www.'):
+            host = host[4:]
+        return host.translate(_DOT_TO_DASH)
 
     def load_prompt_from_md(self, agent_name: str, prompts_dir: str = ".claude/agents") -> Optional[str]:
         """
@@ -93,25 +117,17 @@ class BaseAgent(ABC):
         """
         try:
             prompt_file = Path(prompts_dir) / f"{agent_name}.md"
+            content = read_prompt(agent_name, str(prompts_dir))
 
-            if not prompt_file.exists():
-                self.logger.warning(f"Prompt file not found: {prompt_file}")
+            if content is None:
+                self.logger.warning("Prompt file not found: %s", prompt_file)
                 return None
 
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Remove YAML front matter if present (everything between --- lines)
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    content = parts[2].strip()
-
-            self.logger.info(f"Loaded prompt from {prompt_file}")
+            self.logger.info("Loaded prompt from %s", prompt_file)
             return content
 
         except Exception as e:
-            self.logger.error(f"Error loading prompt from {agent_name}.md: {e}")
+            self.logger.error("Error loading prompt from %s.md: %s", agent_name, e)
             return None
     
     @abstractmethod
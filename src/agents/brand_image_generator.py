@@ -1,14 +1,212 @@
 """Brand image generator - creates simple text-on-background Instagram images."""
 
-from typing import Dict, Any
+import io
+import os
+import copy
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
-import textwrap
 from .base_agent import BaseAgent
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib json module
+    orjson = None
+
+try:
+    import re2 as _overlay_re  # Optional: linear-time matching for the overlay patterns
+except ImportError:
+    _overlay_re = re
+
+def _write_file_bytes(path: Path, data: bytes) -> None:
+    """Write an already-encoded payload straight to a file descriptor.
+
+    Skips the BufferedWriter layer of open('wb'); loops because os.write may
+    perform a partial write.
+    """
+    view = memoryview(data)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# Cross-platform fallbacks probed when the brand font is not installed
+_COMMON_FONTS = (
+    # Sans-serif fonts - most common
+    "Arial", "Helvetica", "DejaVuSans", "Liberation Sans",
+    # Fallback generic names
+    "sans-serif", "default"
+)
+_FONT_LOCATIONS = (
+    "/System/Library/Fonts/{}.ttc",  # macOS
+    "/System/Library/Fonts/{}.ttf",  # macOS
+    "/usr/share/fonts/truetype/dejavu/{}.ttf",  # Linux DejaVu
+    "/usr/share/fonts/truetype/liberation/{}-Regular.ttf",  # Linux Liberation
+    "C:\\Windows\\Fonts\\{}.ttf",  # Windows
+)
+
+@lru_cache(maxsize=64)
+def _resolve_font(font_family: str) -> Tuple[Optional[str], str]:
+    """
+    Find the font file to use for a brand font family.
+
+    Returns (path, kind) where kind is "brand" or "common", or (None, "")
+    when nothing usable is installed. Missing files are skipped with a stat
+    instead of a failed truetype() call, and the result is cached per family
+    so the probe runs once per process. Paths are cached rather than font
+    objects because a FreeType face must not be shared between the rendering
+    threads; each thread loads its own from the path (see _thread_fonts).
+    """
+    brand_font_paths = [
+        f"/System/Library/Fonts/{font_family}.ttf",
+        f"/Library/Fonts/{font_family}.ttf",
+        f"/usr/share/fonts/truetype/{font_family.lower()}/{font_family}.ttf",
+    ]
+    common_font_paths = [
+        location_template.format(font_name)
+        for font_name in _COMMON_FONTS
+        for location_template in _FONT_LOCATIONS
+    ]
+
+    for kind, font_paths in (("brand", brand_font_paths), ("common", common_font_paths)):
+        for font_path in font_paths:
+            if not os.path.isfile(font_path):
+                continue
+            try:
+                ImageFont.truetype(font_path)
+                return font_path, kind
+            except OSError:
+                continue
+
+    return None, ""
+
+# Look for text patterns like: "TEXT OVERLAY: 'Message Here'" or "reading 'Message Here'"
+# These patterns indicate the actual display text - be very specific to avoid capturing descriptions
+_TEXT_PATTERNS = tuple(_overlay_re.compile(pattern) for pattern in (
+    r"TEXT OVERLAY:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"text overlay:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"overlay:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"reading ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"Superposez le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"ajoutez le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
+    r"le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose)",
+    r"texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose)",
+    r"['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose).*?(?:en police|en écriture)",
+    r"['\"]([A-Z][^'\"]*(?:'[^'\"]*)*)['\"].*?(?:in|with|using).*?(?:font|style)",
+    r"['\"]([A-Z][^'\"]*(?:'[^'\"]*)*)['\"].*?(?:diagonally|across|over)",
+))
+
+# Quoted phrases considered when no overlay pattern matches
+_QUOTED_TEXT_RE = re.compile(r"['\"]([^'\"]{5,100})['\"]")
+
+# Quoted fragments that are styling/layout instructions rather than display text
+_QUOTED_REJECT_RE = re.compile(
+    r'^#|\.png\Z|1080|(?i:px|opacity|background|font|color:|turquoise|charcoal|diagonally'
+    r'|across|composition|should feel|spontaneous|cinematic|edgy|reflecting)'
+)
+
+# Leading phrase of an over-long extraction
+_SHORT_PHRASE_PATTERNS = (
+    re.compile(r'^([A-Z][^.]*?)(?:\s+[a-z]|$)'),
+    re.compile(r'^([^.]{1,50})(?:\s+[a-z]|$)'),
+)
+
+
+# Fonts loaded by the current thread. Pillow's FreeTypeFont wraps a single
+# FreeType face, which is not safe to render with from several threads at
+# once, so every rendering thread loads and keeps its own
+_thread_fonts = threading.local()
+
+
+def _number_font():
+    """Load the post-number font once per thread."""
+    font = getattr(_thread_fonts, 'number', None)
+    if font is None:
+        try:
+            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 36)
+        except OSError:
+            font = ImageFont.load_default()
+        _thread_fonts.number = font
+    return font
+
+
+@lru_cache(maxsize=128)
+def _hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """Parse '#RRGGBB', '#RGB' or '#RRGGBBAA' (alpha ignored) with one int() call."""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        hex_color = ''.join(c * 2 for c in hex_color)
+    if len(hex_color) not in (6, 8):
+        raise ValueError(f"Invalid hex colour: #{hex_color}")
+    value = int(hex_color[:6], 16)
+    return (value >> 16, value >> 8 & 0xFF, value & 0xFF)
+
+
+def _wrap_optimal(words: list, font, max_width: float) -> list:
+    """Break words into lines minimising the sum of squared trailing gaps.
+
+    Knuth-Plass style optimal fit over real font advances; the last line is
+    free. A single word wider than max_width still gets a line of its own.
+    """
+    n = len(words)
+    if not n:
+        return []
+    widths = [font.getlength(word) for word in words]
+    space = font.getlength(' ')
+
+    # cost[j]: best cost of setting words[:j]; breaks[j]: start of its last line
+    cost = [0.0] + [float('inf')] * n
+    breaks = [0] * (n + 1)
+    for j in range(1, n + 1):
+        line_width = -space
+        for i in range(j - 1, -1, -1):
+            line_width += widths[i] + space
+            if line_width > max_width and i < j - 1:
+                break
+            gap = 0.0 if j == n else max(max_width - line_width, 0.0)
+            candidate = cost[i] + gap * gap
+            if candidate < cost[j]:
+                cost[j] = candidate
+                breaks[j] = i
+
+    lines = []
+    j = n
+    while j > 0:
+        i = breaks[j]
+        lines.append(' '.join(words[i:j]))
+        j = i
+    lines.reverse()
+    return lines
+
+
+@lru_cache(maxsize=32)
+def _load_design_json(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a design analysis file; the mtime in the key invalidates rewrites."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
 class BrandImageGenerator(BaseAgent):
     """Generates simple Instagram images with brand colors and fonts."""
 
+    # Instagram square format and text padding
+    _W = _H = 1080
+    _PAD = 80
+    _MAX_W = _W - 2 * _PAD
+    _FONT_SIZE = 48
+    _MAX_LINES = 4
+    # Post number sits 30px from the right edge, 60px above the bottom
+    _NUMBER_RIGHT = _W - 30
+    _NUMBER_Y = _H - 60
+
     def __init__(self):
         super().__init__("brand_image_generator", "metrics")
 
@@ -19,154 +217,203 @@ class BrandImageGenerator(BaseAgent):
 
         # Try to find the most recent design analysis file
         design_dir = self.output_dir / "screenshots" / "analyses"
-        design_files = list(design_dir.glob(f"{domain}-design-analysis-*.json"))
+        # Filenames embed a sortable timestamp, so the greatest name is the newest
+        latest_file = max(design_dir.glob(f"{domain}-design-analysis-*.json"), default=None)
 
-        if not design_files:
+        if latest_file is None:
             raise ValueError(f"No design analysis file found for {domain}")
 
-        # Get the most recent file
-        latest_file = sorted(design_files)[-1]
-
-        import json
-        with open(latest_file, 'r') as f:
-            return json.load(f)
+        # Hand out a copy so callers can't mutate the cached parse
+        return copy.deepcopy(_load_design_json(str(latest_file), latest_file.stat().st_mtime_ns))
 
     def hex_to_rgb(self, hex_color: str) -> tuple:
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
 
-    def create_text_image(self, text: str, background_color: str, text_color: str,
-                         font_family: str = None, post_number: int = 1) -> Image.Image:
-        """Create a simple image with text on a colored background."""
-        # Instagram square format
-        width, height = 1080, 1080
+    def load_font(self, font_family: str = None):
+        """Load the brand font at caption size, or the first installed common font."""
+        font_size = self._FONT_SIZE
 
-        # Create image with background color
-        bg_rgb = self.hex_to_rgb(background_color)
-        image = Image.new('RGB', (width, height), bg_rgb)
-        draw = ImageDraw.Draw(image)
+        font_path, font_kind = _resolve_font(font_family)
+        if font_path:
+            self.logger.debug("Loaded %s font: %s", font_kind, font_path)
+            return ImageFont.truetype(font_path, font_size)
 
-        # Try to load custom font, fallback to common system fonts
-        font = None
-        font_size = 48
-
-        # Try brand font first
-        brand_font_paths = [
-            f"/System/Library/Fonts/{font_family}.ttf",
-            f"/Library/Fonts/{font_family}.ttf",
-            f"/usr/share/fonts/truetype/{font_family.lower()}/{font_family}.ttf",
-        ]
+        # Last resort: use PIL default at larger size
+        try:
+            font = ImageFont.load_default(size=font_size)
+            self.logger.warning("Using PIL default font at size %d", font_size)
+        except:
+            font = ImageFont.load_default()
+            self.logger.warning("Using PIL default font (size cannot be set)")
+        return font
+
+    def _thread_font(self, font_family: str = None):
+        """load_font, once per rendering thread and font family."""
+        fonts = getattr(_thread_fonts, 'captions', None)
+        if fonts is None:
+            fonts = _thread_fonts.captions = {}
+        font = fonts.get(font_family)
+        if font is None:
+            font = fonts[font_family] = self.load_font(font_family)
+        return font
 
-        for font_path in brand_font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                self.logger.info(f"Loaded brand font: {font_path}")
-                break
-            except:
-                continue
+    def create_text_image(self, text: str, background_color: str, text_color: str,
+                         font_family: str = None, post_number: int = 1,
+                         base_image: Optional[Image.Image] = None) -> Image.Image:
+        """Create a simple image with text on a colored background.
 
-        # If brand font not found, try most common cross-platform fonts
-        if not font:
-            common_fonts = [
-                # Sans-serif fonts - most common
-                "Arial", "Helvetica", "DejaVuSans", "Liberation Sans",
-                # Fallback generic names
-                "sans-serif", "default"
-            ]
+        base_image, when given, is a pre-filled background canvas that is
+        copied instead of allocating and filling a fresh one.
+        """
+        # Create image with background color
+        if base_image is not None:
+            image = base_image.copy()
+        else:
+            image = Image.new('RGB', (self._W, self._H), self.hex_to_rgb(background_color))
 
-            font_locations = [
-                "/System/Library/Fonts/{}.ttc",  # macOS
-                "/System/Library/Fonts/{}.ttf",  # macOS
-                "/usr/share/fonts/truetype/dejavu/{}.ttf",  # Linux DejaVu
-                "/usr/share/fonts/truetype/liberation/{}-Regular.ttf",  # Linux Liberation
-                "C:\\Windows\\Fonts\\{}.ttf",  # Windows
-            ]
+        self._render_text_onto(image, text, self.load_font(font_family),
+                               self.hex_to_rgb(text_color), post_number)
+        return image
 
-            for font_name in common_fonts:
-                for location_template in font_locations:
-                    try:
-                        font_path = location_template.format(font_name)
-                        font = ImageFont.truetype(font_path, font_size)
-                        self.logger.info(f"Loaded common font: {font_path}")
-                        break
-                    except:
-                        continue
-                if font:
-                    break
+    def _render_text_onto(self, image: Image.Image, text: str, font,
+                          text_rgb: Tuple[int, int, int], post_number: int) -> None:
+        """Draw the centred caption and the corner post number onto image in place."""
+        draw = ImageDraw.Draw(image)
 
-        # Last resort: use PIL default at larger size
-        if not font:
-            try:
-                font = ImageFont.load_default(size=font_size)
-                self.logger.warning(f"Using PIL default font at size {font_size}")
-            except:
-                font = ImageFont.load_default()
-                self.logger.warning("Using PIL default font (size cannot be set)")
-
-        # Wrap text to fit width with padding
-        padding = 80
-        max_width = width - (padding * 2)
-
-        # Wrap text manually with better French text handling
-        words = text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            # Better width estimation for French text (account for accents and longer words)
-            # French text tends to be longer, so use smaller char width
-            char_width = 30 if any(char in word for char in 'àâäéèêëïîôöùûüÿçñ') else 36
-            if len(test_line) * char_width < max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
+        # Wrap text using measured glyph widths (handles accented text natively)
+        lines = _wrap_optimal(text.split(), font, self._MAX_W)
 
         # Limit to reasonable number of lines but preserve French text
-        if len(lines) > 4:
-            lines = lines[:4]
+        if len(lines) > self._MAX_LINES:
+            lines = lines[:self._MAX_LINES]
             # Don't truncate French text, just limit lines
 
         wrapped_text = '\n'.join(lines)
 
-        # Get text bounding box
-        text_bbox = draw.multiline_textbbox((0, 0), wrapped_text, font=font)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
+        # Increase line spacing by 1.5x (spacing parameter adds extra pixels between lines)
+        line_spacing = font.size >> 1  # Add 50% of font size as extra spacing
+
+        # Measure the block from font metrics instead of a second layout pass:
+        # multiline_text advances each line by the height of "A" plus spacing
+        line_height = font.getbbox('A')[3] + line_spacing
+        text_width = max(font.getlength(line) for line in lines) if lines else 0
+        text_height = len(lines) * line_height - line_spacing if lines else 0
 
         # Center text
-        x = (width - text_width) // 2
-        y = (height - text_height) // 2
+        x = (self._W - text_width) // 2
+        y = (self._H - text_height) // 2
 
         # Draw text with increased line spacing
-        text_rgb = self.hex_to_rgb(text_color)
-        # Increase line spacing by 1.5x (spacing parameter adds extra pixels between lines)
-        line_spacing = int(font.size * 0.5)  # Add 50% of font size as extra spacing
         draw.multiline_text((x, y), wrapped_text, fill=text_rgb, font=font, align='center', spacing=line_spacing)
 
         # Add post number in corner
-        number_font_size = 36
-        try:
-            number_font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", number_font_size)
-        except:
-            number_font = ImageFont.load_default()
+        number_font = _number_font()
 
         number_text = f"#{post_number}"
-        number_bbox = draw.textbbox((0, 0), number_text, font=number_font)
-        number_width = number_bbox[2] - number_bbox[0]
+        number_width = number_font.getlength(number_text)
 
         # Bottom right corner
-        number_x = width - number_width - 30
-        number_y = height - 60
-        draw.text((number_x, number_y), number_text, fill=text_rgb, font=number_font)
+        draw.text((self._NUMBER_RIGHT - number_width, self._NUMBER_Y), number_text, fill=text_rgb, font=number_font)
+
+    def extract_display_text(self, prompt_info: Dict[str, Any], index: int) -> str:
+        """Extract the short message to render from a prompt's gemini_prompt text."""
+        gemini_prompt = prompt_info.get("gemini_prompt", "")
+        theme = prompt_info.get("theme", "")
+
+        # Patterns are tried in priority order; search() stops at the first
+        # match instead of collecting every match like findall() did
+        message_text = None
+        for i, pattern in enumerate(_TEXT_PATTERNS):
+            match = pattern.search(gemini_prompt)
+            if match:
+                message_text = match.group(1)
+                self.logger.debug("Text extracted using pattern %d: '%s'", i + 1, message_text)
+                break
 
-        return image
+        # If no pattern match, try extracting quoted text but filter better
+        if not message_text:
+            for text in _QUOTED_TEXT_RE.findall(gemini_prompt):
+                # Skip if it looks like code, hex colors, file paths, dimensions, or descriptive text
+                if not _QUOTED_REJECT_RE.search(text) and len(text.split()) <= 6:  # Limit to short phrases
+                    message_text = text
+                    break
+
+        # Fallback to theme or headline
+        text = message_text or theme or prompt_info.get("headline", "") or f"Post {index}"
+
+        # Clean up text and ensure it's only the display text
+        text = text.strip()
+        
+        # Additional cleaning to remove any descriptive text that might have been captured
+        # Split by common descriptive words and take only the first part
+        descriptive_words = ['diagonally', 'across', 'image', 'composition', 'should', 'feel', 'spontaneous', 'cinematic', 'edgy', 'reflecting', 'en police', 'en écriture', 'couleur', 'lumineux', 'chaleureux', 'confortables', 'neutres', 'visage', 'sourire', 'introspectif', 'arrière-plan', 'esquisses', 'texture', 'artistique', 'lumière', 'naturelle', 'baigne', 'scène', 'créant', 'atmosphère', 'paisible', 'superposez', 'ajoutez', 'surimpression']
+        for word in descriptive_words:
+            if word in text.lower():
+                text = text.split(word)[0].strip()
+                break
+        
+        # If text is still too long (more than 6 words), try to extract just the first meaningful phrase
+        if len(text.split()) > 6:
+            # Look for common French text patterns
+            for pattern in _SHORT_PHRASE_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    text = match.group(1).strip()
+                    break
+        
+        # Remove trailing punctuation that might be from descriptions
+        text = text.rstrip('.,;:!?')
+        
+        # Log the extracted text for debugging
+        self.logger.debug("Extracted text for post %d: '%s'", index, text)
+        return text
+
+    def _generate_one(self, index: int, prompt_info: Dict[str, Any], total: int, domain: str,
+                      output_dir: Path, template: Image.Image, font_family: Optional[str],
+                      text_rgb: Tuple[int, int, int]) -> Dict[str, Any]:
+        """Render and save a single post image, returning its result entry."""
+        text = self.extract_display_text(prompt_info, index)
+
+        try:
+            self.logger.debug("Generating image %d/%d for %s", index, total, domain)
+
+            # Create simple text image on a copy of the shared background
+            image = template.copy()
+            self._render_text_onto(image, text, self._thread_font(font_family), text_rgb, index)
+
+            filename = f"{domain}-post-{index}.png"
+
+            # Two flat colours plus antialiased edges fit a 16-entry palette,
+            # a third of the RGB bytes for zlib to chew through
+            image = image.convert('P', palette=Image.Palette.ADAPTIVE, colors=16)
+
+            # Encode in memory, then write the finished PNG in one pass
+            buffer = io.BytesIO()
+            image.save(buffer, 'PNG', compress_level=6)
+            image_data = buffer.getbuffer()  # zero-copy view of the encoded PNG
+
+            # Save image as PNG: {domain-name}-post-{number}.png
+            filepath = output_dir / filename
+            _write_file_bytes(filepath, image_data)
+            self.logger.debug("Saved image: %s", filepath)
+
+            return {
+                "post_number": index,
+                "filename": filename,
+                "filepath": str(filepath),
+                "file_size": len(image_data),
+                "text": text[:100],
+                "status": "success"
+            }
+
+        except Exception as e:
+            self.logger.error("Error generating image %d: %s", index, e)
+            return {
+                "post_number": index,
+                "status": "failed",
+                "error": str(e)
+            }
 
     def process(self, url: str, prompts_data: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -188,9 +435,9 @@ class BrandImageGenerator(BaseAgent):
         # Load design analysis to get brand colors and fonts
         try:
             design_data = self.get_design_data(url)
-            self.logger.info(f"Loaded design analysis for {domain}")
+            self.logger.info("Loaded design analysis for %s", domain)
         except Exception as e:
-            self.logger.error(f"Could not load design analysis: {e}")
+            self.logger.error("Could not load design analysis: %s", e)
             raise
 
         # Extract brand colors
@@ -209,14 +456,14 @@ class BrandImageGenerator(BaseAgent):
         if abs(bg_brightness - text_brightness) < 100:
             # Not enough contrast, use black or white based on background
             text_color = "#000000" if bg_brightness > 128 else "#FFFFFF"
-            self.logger.info(f"Adjusted text color for contrast: {text_color}")
+            self.logger.info("Adjusted text color for contrast: %s", text_color)
 
         # Extract font family
         typography_kit = design_data.get("typography_kit", {})
         likely_families = typography_kit.get("likely_families", [])
         font_family = likely_families[0].get("name", "Helvetica") if likely_families else "Helvetica"
 
-        self.logger.info(f"Using background: {background_color}, text: {text_color}, font: {font_family}")
+        self.logger.info("Using background: %s, text: %s, font: %s", background_color, text_color, font_family)
 
         # Extract prompts from the prompts_data JSON
         prompts = prompts_data.get("prompts", []) or prompts_data.get("instagram_prompts", [])
@@ -229,7 +476,7 @@ class BrandImageGenerator(BaseAgent):
 
         # Create output directory for images: metrics/images/{domain-name}/
         output_dir = self.output_dir / "images" / domain
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self.ensure_dir(output_dir)
 
         generation_results = {
             "domain": domain,
@@ -240,149 +487,35 @@ class BrandImageGenerator(BaseAgent):
             "background_color": background_color,
             "text_color": text_color,
             "font_family": font_family,
-            "images": []
+            # One slot per post, filled in post order as renders complete
+            "images": [None] * len(prompts)
         }
 
-        # Generate each image
-        for index, prompt_info in enumerate(prompts, 1):
-            # Extract the actual message text from the gemini_prompt
-            import re
-
-            gemini_prompt = prompt_info.get("gemini_prompt", "")
-            theme = prompt_info.get("theme", "")
-
-            # Look for text patterns like: "TEXT OVERLAY: 'Message Here'" or "reading 'Message Here'"
-            # These patterns indicate the actual display text - be very specific to avoid capturing descriptions
-            text_patterns = [
-                r"TEXT OVERLAY:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"text overlay:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"overlay:\s*['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"reading ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"Superposez le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"ajoutez le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"]",
-                r"le texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose)",
-                r"texte ['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose)",
-                r"['\"]([^'\"]*(?:'[^'\"]*)*)['\"].*?(?:apparaît|superpose).*?(?:en police|en écriture)",
-                r"['\"]([A-Z][^'\"]*(?:'[^'\"]*)*)['\"].*?(?:in|with|using).*?(?:font|style)",
-                r"['\"]([A-Z][^'\"]*(?:'[^'\"]*)*)['\"].*?(?:diagonally|across|over)",
-            ]
-
-            message_text = None
-            for i, pattern in enumerate(text_patterns):
-                matches = re.findall(pattern, gemini_prompt)
-                if matches:
-                    # For patterns with groups, get the last capturing group
-                    if isinstance(matches[0], tuple):
-                        message_text = matches[0][-1]
-                    else:
-                        message_text = matches[0]
-                    self.logger.info(f"Text extracted using pattern {i+1}: '{message_text}'")
-                    break
-
-            # If no pattern match, try extracting quoted text but filter better
-            if not message_text:
-                quoted_texts = re.findall(r"['\"]([^'\"]{5,100})['\"]", gemini_prompt)
-                for text in quoted_texts:
-                    # Skip if it looks like code, hex colors, file paths, dimensions, or descriptive text
-                    if (not text.startswith('#') and
-                        not text.endswith('.png') and
-                        not 'px' in text.lower() and
-                        not 'opacity' in text.lower() and
-                        not '1080' in text and
-                        not 'background' in text.lower() and
-                        not 'font' in text.lower() and
-                        not 'color:' in text.lower() and
-                        not 'turquoise' in text.lower() and
-                        not 'charcoal' in text.lower() and
-                        not 'diagonally' in text.lower() and
-                        not 'across' in text.lower() and
-                        not 'composition' in text.lower() and
-                        not 'should feel' in text.lower() and
-                        not 'spontaneous' in text.lower() and
-                        not 'cinematic' in text.lower() and
-                        not 'edgy' in text.lower() and
-                        not 'reflecting' in text.lower() and
-                        len(text.split()) <= 6):  # Limit to short phrases
-                        message_text = text
-                        break
-
-            # Fallback to theme or headline
-            text = message_text or theme or prompt_info.get("headline", "") or f"Post {index}"
-
-            # Clean up text and ensure it's only the display text
-            text = text.strip()
-            
-            # Additional cleaning to remove any descriptive text that might have been captured
-            # Split by common descriptive words and take only the first part
-            descriptive_words = ['diagonally', 'across', 'image', 'composition', 'should', 'feel', 'spontaneous', 'cinematic', 'edgy', 'reflecting', 'en police', 'en écriture', 'couleur', 'lumineux', 'chaleureux', 'confortables', 'neutres', 'visage', 'sourire', 'introspectif', 'arrière-plan', 'esquisses', 'texture', 'artistique', 'lumière', 'naturelle', 'baigne', 'scène', 'créant', 'atmosphère', 'paisible', 'superposez', 'ajoutez', 'surimpression']
-            for word in descriptive_words:
-                if word in text.lower():
-                    text = text.split(word)[0].strip()
-                    break
-            
-            # If text is still too long (more than 6 words), try to extract just the first meaningful phrase
-            if len(text.split()) > 6:
-                # Look for common French text patterns
-                import re
-                short_patterns = [
-                    r'^([A-Z][^.]*?)(?:\s+[a-z]|$)',
-                    r'^([^.]{1,50})(?:\s+[a-z]|$)',
-                ]
-                for pattern in short_patterns:
-                    match = re.search(pattern, text)
-                    if match:
-                        text = match.group(1).strip()
-                        break
-            
-            # Remove trailing punctuation that might be from descriptions
-            text = text.rstrip('.,;:!?')
-            
-            # Log the extracted text for debugging
-            self.logger.info(f"Extracted text for post {index}: '{text}'")
+        # Every post shares the background and text colour, so prepare them
+        # once and let each worker copy the canvas and draw its caption with
+        # its own thread's font
+        template = Image.new('RGB', (self._W, self._H), self.hex_to_rgb(background_color))
+        text_rgb = self.hex_to_rgb(text_color)
 
-            try:
-                self.logger.info(f"Generating image {index}/{len(prompts)} for {domain}")
-
-                # Create simple text image
-                image = self.create_text_image(
-                    text=text,
-                    background_color=background_color,
-                    text_color=text_color,
-                    font_family=font_family,
-                    post_number=index
-                )
-
-                # Save image as PNG: {domain-name}-post-{number}.png
-                filename = f"{domain}-post-{index}.png"
-                filepath = output_dir / filename
-
-                image.save(filepath, 'PNG', optimize=True)
-                file_size = filepath.stat().st_size
-
-                self.logger.info(f"Saved image: {filepath}")
-
-                generation_results["images"].append({
-                    "post_number": index,
-                    "filename": filename,
-                    "filepath": str(filepath),
-                    "file_size": file_size,
-                    "text": text[:100],
-                    "status": "success"
-                })
-
-            except Exception as e:
-                self.logger.error(f"Error generating image {index}: {e}")
-                generation_results["images"].append({
-                    "post_number": index,
-                    "status": "failed",
-                    "error": str(e)
-                })
+        # Render images concurrently; PIL releases the GIL while encoding and
+        # the PNG writes are I/O-bound, so posts overlap instead of queueing
+        max_workers = min(len(prompts), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._generate_one, index, prompt_info, len(prompts), domain,
+                                output_dir, template, font_family, text_rgb)
+                for index, prompt_info in enumerate(prompts, 1)
+            ]
+            for future in as_completed(futures):
+                result = future.result()
+                generation_results["images"][result["post_number"] - 1] = result
 
         # Save generation metadata to metrics/images/{domain-name}/{domain-name}-metadata.json
         metadata_filename = f"{domain}-metadata.json"
         self.save_json(generation_results, metadata_filename, f"images/{domain}")
 
-        self.logger.info(f"Generated {len([img for img in generation_results['images'] if img.get('status') == 'success'])} images in metrics/images/{domain}/")
+        success_count = sum(1 for img in generation_results["images"] if img.get("status") == "success")
+        self.logger.info("Generated %d images in metrics/images/%s/", success_count, domain)
         return generation_results
 
     def get_output_filename(self, domain: str) -> str:
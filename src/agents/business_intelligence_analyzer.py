@@ -1,109 +1,413 @@
 """Business intelligence analyzer agent - gathers comprehensive company data."""
 
+import codecs
+import copy
+import hashlib
+import os
+import threading
+import time
 import requests
 import re
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer
+import soupsieve
 from urllib.parse import urljoin, urlparse
 from .base_agent import BaseAgent
 from ai_providers.ai_factory import AIProviderFactory
 from ai_providers.base_provider import AICapability
 
+try:
+    import re2
+except ImportError:  # Optional: RE2 matches a keyword alternation as one DFA pass
+    re2 = None
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:  # Optional: fall back to bs4's pure-Python html.parser
+    etree = lxml_html = None
+
+# The libxml2-backed lxml parser is several times faster than html.parser
+_HTML_PARSER = 'lxml' if lxml_html is not None else 'html.parser'
+
+# String types get_text() returns by default (excludes comments, script and style bodies)
+_TEXT_STRING_TYPES = (NavigableString, CData)
+
+# Raw HTML read per page; enough for <head>, navigation and footer links on
+# bloated pages while bounding download, decode and parse work
+_MAX_HTML_BYTES = 1_000_000
+
+
+# A byte-order mark overrides any declared charset, as in browsers
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def _decode_html(body: bytes, encoding: Optional[str]) -> str:
+    """
+    Decode a page body with its declared encoding, defaulting to UTF-8.
+
+    Unlike response.text this never falls back to response.apparent_encoding,
+    whose charset detection is a slow pure-Python pass over the whole body.
+    """
+    for bom, bom_encoding in _BOMS:
+        if body.startswith(bom):
+            encoding = bom_encoding
+            break
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+def _read_html_prefix(response: requests.Response, limit: int = _MAX_HTML_BYTES) -> str:
+    """Decode at most `limit` bytes of a streamed response with _decode_html."""
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= limit:
+            break
+    return _decode_html(b''.join(chunks)[:limit], response.encoding)
+
+
+# Browser-like headers sent with every page request
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive'
+}
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# The social-link scan reads only links and og: meta tags, so a page fetched
+# just for it skips building the rest of the tree
+_SOCIAL_STRAINER = SoupStrainer(['a', 'meta'])
+
+# Profile URL patterns per social media platform
+_SOCIAL_PATTERN_SOURCES = {
+    'facebook': [
+        r'facebook\.com/[^/\s]+',
+        r'fb\.com/[^/\s]+',
+        r'facebook\.com/pages/[^/\s]+'
+    ],
+    'twitter': [
+        r'twitter\.com/[^/\s]+',
+        r'x\.com/[^/\s]+',
+        r't\.co/[^/\s]+'
+    ],
+    'instagram': [
+        r'instagram\.com/[^/\s]+',
+        r'instagr\.am/[^/\s]+'
+    ],
+    'linkedin': [
+        r'linkedin\.com/company/[^/\s]+',
+        r'linkedin\.com/in/[^/\s]+',
+        r'linkedin\.com/org/[^/\s]+'
+    ],
+    'youtube': [
+        r'youtube\.com/channel/[^/\s]+',
+        r'youtube\.com/c/[^/\s]+',
+        r'youtube\.com/user/[^/\s]+',
+        r'youtube\.com/@[^/\s]+',
+        r'youtu\.be/[^/\s]+'
+    ],
+    'tiktok': [
+        r'tiktok\.com/@[^/\s]+',
+        r'vm\.tiktok\.com/[^/\s]+'
+    ],
+    'pinterest': [
+        r'pinterest\.com/[^/\s]+',
+        r'pin\.it/[^/\s]+'
+    ],
+    'snapchat': [
+        r'snapchat\.com/add/[^/\s]+',
+        r'snap\.ly/[^/\s]+'
+    ],
+    'whatsapp': [
+        r'wa\.me/[^/\s]+',
+        r'whatsapp\.com/send\?phone=[^/\s]+'
+    ],
+    'telegram': [
+        r't\.me/[^/\s]+',
+        r'telegram\.me/[^/\s]+'
+    ],
+    'discord': [
+        r'discord\.gg/[^/\s]+',
+        r'discord\.com/invite/[^/\s]+'
+    ],
+    'reddit': [
+        r'reddit\.com/r/[^/\s]+',
+        r'reddit\.com/u/[^/\s]+'
+    ],
+    'github': [
+        r'github\.com/[^/\s]+'
+    ],
+    'behance': [
+        r'behance\.net/[^/\s]+'
+    ],
+    'dribbble': [
+        r'dribbble\.com/[^/\s]+'
+    ],
+    'medium': [
+        r'medium\.com/@[^/\s]+',
+        r'medium\.com/[^/\s]+'
+    ]
+}
+
+# Common About page link patterns (multilingual support)
+_ABOUT_LINK_PATTERN_SOURCES = [
+    # English
+    r'about', r'about-us', r'about-me', r'our-story', r'team', r'leadership', r'founder', r'meet-the-team',
+    # Danish - more specific patterns
+    r'^om$', r'om-os', r'om-mig', r'vores-historie', r'hold', r'ledelse', r'om-universal', r'om-',
+    # French
+    r'à-propos', r'à-propos-de-nous', r'à-propos-de-moi', r'notre-histoire', r'équipe', r'direction',
+    # German
+    r'über', r'über-uns', r'über-mich', r'unser-geschichte', r'team', r'führung',
+    # Spanish
+    r'acerca-de', r'sobre-nosotros', r'sobre-mí', r'nuestra-historia', r'equipo', r'liderazgo',
+    # Italian
+    r'chi-siamo', r'su-di-noi', r'su-di-me', r'la-nostra-storia', r'squadra', r'leadership',
+    # Portuguese
+    r'sobre', r'sobre-nós', r'sobre-mim', r'nossa-história', r'equipe', r'liderança',
+    # Dutch
+    r'over', r'over-ons', r'over-mij', r'ons-verhaal', r'team', r'leiderschap',
+    # Swedish - more specific patterns
+    r'^om$', r'om-oss', r'om-mig', r'vår-historia', r'team', r'ledning', r'om-',
+    # Norwegian - more specific patterns
+    r'^om$', r'om-oss', r'om-meg', r'vår-historie', r'team', r'ledelse', r'om-',
+    # Finnish
+    r'tietoa', r'tietoa-meistä', r'tietoa-minusta', r'tarinamme', r'tiimi', r'johto'
+]
+
+# About-section heading patterns
+_ABOUT_HEADING_PATTERN_SOURCES = [
+    r'about\s+(?:us|me|the\s+founder|the\s+team)',
+    r'our\s+story',
+    r'meet\s+the\s+founder',
+    r'founder\'?s?\s+story',
+    r'leadership',
+    r'team'
+]
+
+# Compiled once at import rather than on every link and heading checked.
+# The patterns are all lowercase and every caller lowercases its text once,
+# so they skip re.IGNORECASE and its per-character case folding.
+# All social patterns share one regex: each platform is a named alternative
+# behind its own lazy prefix, so a single call tries the platforms in order
+# and match.lastgroup names the first one found anywhere in the href
+_SOCIAL_LINK_RE = re.compile(
+    '(?:' + '|'.join(
+        f"(?s:.*?)(?P<{platform}>{'|'.join(patterns)})"
+        for platform, patterns in _SOCIAL_PATTERN_SOURCES.items()
+    ) + ')'
+)
+# bs4 attribute filters, matched with search() instead of a per-node lambda
+_SOCIAL_ICON_CLASS_RE = re.compile('social|facebook|twitter|instagram|linkedin|youtube|tiktok', re.IGNORECASE)
+_OG_PROPERTY_RE = re.compile('og:')
+_SPA_ROOT_ID_RE = re.compile(r'\A(?:root|app|main)\Z', re.IGNORECASE)
+# Every social pattern starts with a literal host and slash ('x\.com/...'),
+# so an href containing none of these can skip the regex entirely
+_SOCIAL_DOMAIN_TOKENS = tuple(dict.fromkeys(
+    pattern.split('/', 1)[0].replace('\\.', '.') + '/'
+    for patterns in _SOCIAL_PATTERN_SOURCES.values() for pattern in patterns
+))
+# Languages share words ('team', 'om-', ...); a repeated pattern can never
+# match where its first occurrence did not
+_ABOUT_LINK_PATTERNS = tuple(re.compile(pattern) for pattern in dict.fromkeys(_ABOUT_LINK_PATTERN_SOURCES))
+_ABOUT_HEADING_PATTERNS = tuple(re.compile(pattern) for pattern in _ABOUT_HEADING_PATTERN_SOURCES)
+
+# Navigation elements (header, nav, main menu, mega menus) and footer elements
+# searched for About links; each group is one compiled selector, so a page
+# is walked once per group instead of once per selector
+_NAV_SELECTOR = soupsieve.compile(', '.join((
+    'nav', 'header', '.nav', '.navigation', '.menu', '.header',
+    '[role="navigation"]', '.navbar', '.main-nav', '.top-nav',
+    # Mega menu and dropdown selectors
+    '.mega-menu', '.dropdown', '.submenu', '.sub-menu', '.mega-nav',
+    '.dropdown-menu', '.nav-dropdown', '.menu-dropdown', '.mega-dropdown',
+    '.nav-item', '.menu-item', '.nav-link', '.menu-link'
+)))
+_FOOTER_SELECTOR = soupsieve.compile(', '.join((
+    'footer', '.footer', '#footer', '.site-footer', '.page-footer'
+)))
+
+# A bare tag name ('main') or single class ('.bio') selector
+_SIMPLE_SELECTOR_RE = re.compile(r'(\.)?([\w-]+)')
+
+
+def _select(soup: BeautifulSoup, selector: str) -> List[Any]:
+    """soup.select(selector), through the cheaper find_all for a bare tag name or single class."""
+    simple = _SIMPLE_SELECTOR_RE.fullmatch(selector)
+    if simple is None:
+        return soup.select(selector)
+    if simple.group(1):
+        return soup.find_all(class_=simple.group(2))
+    return soup.find_all(simple.group(2))
+
+
+# Page text that suggests the page itself talks about its founders
+_FOUNDER_KEYWORDS = (
+    'founder', 'co-founder', 'ceo', 'cto', 'president', 'director',
+    'about the founder', 'meet the founder', 'our founder',
+    'leadership', 'team', 'about us', 'our story', 'about me',
+    'owner', 'creator', 'started', 'began', 'established',
+    'my name is', 'i am', 'i founded', 'i started'
+)
+_FOUNDER_KEYWORD_RE = re2.compile('|'.join(map(re.escape, _FOUNDER_KEYWORDS))) if re2 is not None else None
+
+
+def _mentions_founder(text: str) -> bool:
+    """Whether lowercased page text contains any founder keyword, in one pass when RE2 is available."""
+    if _FOUNDER_KEYWORD_RE is not None:
+        return _FOUNDER_KEYWORD_RE.search(text) is not None
+    return any(keyword in text for keyword in _FOUNDER_KEYWORDS)
+
+
+def _is_cacheable_analysis(result: Any) -> bool:
+    """Whether an analyze_website result is a real analysis, not a raw_analysis/parsing_error fallback."""
+    return isinstance(result, dict) and 'parsing_error' not in result
+
+
+# Recently fetched pages are re-parsed rather than re-downloaded for this long
+_HTML_MEMO_TTL = 300
+_HTML_MEMO_SIZE = 64
+
+# How long a cached website analysis is reused before asking the AI again
+_AI_CACHE_TTL = 24 * 60 * 60
+
+# Elements whose text never belongs in the page summary sent to the AI
+_NON_CONTENT_TAGS = frozenset(('script', 'style', 'noscript', 'iframe', 'svg'))
+
+
+def _in_non_content(node) -> bool:
+    return any(parent.name in _NON_CONTENT_TAGS for parent in node.parents)
+
+
+def _content_text(soup: BeautifulSoup) -> str:
+    """soup.get_text('\\n', strip=True) with non-content elements left out, without decomposing them."""
+    return '\n'.join(
+        text for text in (
+            string.strip() for string in soup.find_all(string=True)
+            if type(string) in _TEXT_STRING_TYPES and not _in_non_content(string)
+        ) if text
+    )
+
+
+# Also dropped before lxml text extraction: bs4's get_text() skips the
+# strings of <template>, <rt> and <rp> by default
+_LXML_STRIP_TAGS = tuple(_NON_CONTENT_TAGS | {'template', 'rt', 'rp'})
+
+
+def _summarize_html(html: str) -> Tuple[str, str, str, str]:
+    """
+    Return (title, meta description, meta keywords, visible text) of a page.
+
+    With lxml the page is parsed, stripped of non-content elements and its
+    text gathered by libxml2 in C; without it the bs4 tree is walked instead.
+    """
+    if lxml_html is None:
+        soup = BeautifulSoup(html, _HTML_PARSER)
+        return (*_page_metadata(soup), _content_text(soup))
+
+    try:
+        # Parse UTF-8 bytes so an XML encoding declaration in the page is moot
+        tree = lxml_html.document_fromstring(
+            html.encode('utf-8'), parser=lxml_html.HTMLParser(encoding='utf-8')
+        )
+    except etree.ParserError:  # Empty document
+        return '', '', '', ''
+    etree.strip_elements(tree, *_LXML_STRIP_TAGS, with_tail=False)
+
+    title = tree.find('.//title')
+    description = keywords = None
+    for meta in tree.iter('meta'):
+        name = meta.get('name')
+        if name == 'description' and description is None:
+            description = meta.get('content', '')
+        elif name == 'keywords' and keywords is None:
+            keywords = meta.get('content', '')
+
+    text = '\n'.join(text for text in (string.strip() for string in tree.itertext()) if text)
+    return (title.text_content().strip() if title is not None else '',
+            description or '', keywords or '', text)
+
+
+def _page_metadata(soup: BeautifulSoup) -> Tuple[str, str, str]:
+    """
+    Return (title, meta description, meta keywords) from one walk over title/meta tags.
+
+    Each value comes from the first matching tag outside non-content elements,
+    matching what three separate find() calls on the cleaned tree returned.
+    """
+    title = description = keywords = None
+    for tag in soup.find_all(['title', 'meta']):
+        if tag.name == 'title':
+            if title is not None or _in_non_content(tag):
+                continue
+            title = tag.get_text().strip()
+        else:
+            name = tag.get('name')
+            if name == 'description' and description is None and not _in_non_content(tag):
+                description = tag.get('content', '')
+            elif name == 'keywords' and keywords is None and not _in_non_content(tag):
+                keywords = tag.get('content', '')
+        if title is not None and description is not None and keywords is not None:
+            break
+    return title or '', description or '', keywords or ''
+
 class BusinessIntelligenceAnalyzer(BaseAgent):
     """Gathers comprehensive business intelligence about companies."""
 
-    def __init__(self):
+    # Result files are written off the request path; the executor's worker
+    # threads are joined at interpreter exit, so queued writes still land
+    _io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bi-save")
+
+    def __init__(self, ai_providers: Optional[Dict[str, str]] = None):
         super().__init__("business_intelligence_analyzer", "metrics")
-        self.ai_provider = AIProviderFactory.get_configured_provider(AICapability.WEB_ANALYSIS)
+        self.ai_provider = AIProviderFactory.get_configured_provider(
+            AICapability.WEB_ANALYSIS, (ai_providers or {}).get(AICapability.WEB_ANALYSIS.value)
+        )
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive'
-        })
+        self.session.headers.update(_DEFAULT_HEADERS)
+        # One pooled adapter for every page this analyzer fetches, with a
+        # couple of quick retries for transient connection/5xx failures
+        adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # ETag/Last-Modified validators and bodies for conditional re-fetches
+        self.http_cache_dir = self.output_dir / "cache" / "http"
+        # Website analyses keyed by the exact content, prompt and model sent
+        self.ai_cache_dir = self.output_dir / "cache" / "ai"
+        # Page HTML by URL, least recently used first. Parsed trees are not
+        # kept because the founder scan decomposes tags in the one it gets
+        self._html_memo: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._html_memo_lock = threading.Lock()
 
-    def extract_social_media_links(self, url: str) -> List[Dict[str, Any]]:
-        """Extract social media links from a website."""
+    def extract_social_media_links(self, url: str, soup: Optional[BeautifulSoup] = None) -> List[Dict[str, Any]]:
+        """Extract social media links from a website (or from its already-parsed soup)."""
         social_media_accounts = []
         
         try:
             # Fetch the website content
-            soup = self._fetch_and_parse(url)
+            if soup is None:
+                soup = self._fetch_and_parse(url, parse_only=_SOCIAL_STRAINER)
             if not soup:
                 return social_media_accounts
             
-            # Define social media platform patterns
-            social_patterns = {
-                'facebook': [
-                    r'facebook\.com/[^/\s]+',
-                    r'fb\.com/[^/\s]+',
-                    r'facebook\.com/pages/[^/\s]+'
-                ],
-                'twitter': [
-                    r'twitter\.com/[^/\s]+',
-                    r'x\.com/[^/\s]+',
-                    r't\.co/[^/\s]+'
-                ],
-                'instagram': [
-                    r'instagram\.com/[^/\s]+',
-                    r'instagr\.am/[^/\s]+'
-                ],
-                'linkedin': [
-                    r'linkedin\.com/company/[^/\s]+',
-                    r'linkedin\.com/in/[^/\s]+',
-                    r'linkedin\.com/org/[^/\s]+'
-                ],
-                'youtube': [
-                    r'youtube\.com/channel/[^/\s]+',
-                    r'youtube\.com/c/[^/\s]+',
-                    r'youtube\.com/user/[^/\s]+',
-                    r'youtube\.com/@[^/\s]+',
-                    r'youtu\.be/[^/\s]+'
-                ],
-                'tiktok': [
-                    r'tiktok\.com/@[^/\s]+',
-                    r'vm\.tiktok\.com/[^/\s]+'
-                ],
-                'pinterest': [
-                    r'pinterest\.com/[^/\s]+',
-                    r'pin\.it/[^/\s]+'
-                ],
-                'snapchat': [
-                    r'snapchat\.com/add/[^/\s]+',
-                    r'snap\.ly/[^/\s]+'
-                ],
-                'whatsapp': [
-                    r'wa\.me/[^/\s]+',
-                    r'whatsapp\.com/send\?phone=[^/\s]+'
-                ],
-                'telegram': [
-                    r't\.me/[^/\s]+',
-                    r'telegram\.me/[^/\s]+'
-                ],
-                'discord': [
-                    r'discord\.gg/[^/\s]+',
-                    r'discord\.com/invite/[^/\s]+'
-                ],
-                'reddit': [
-                    r'reddit\.com/r/[^/\s]+',
-                    r'reddit\.com/u/[^/\s]+'
-                ],
-                'github': [
-                    r'github\.com/[^/\s]+'
-                ],
-                'behance': [
-                    r'behance\.net/[^/\s]+'
-                ],
-                'dribbble': [
-                    r'dribbble\.com/[^/\s]+'
-                ],
-                'medium': [
-                    r'medium\.com/@[^/\s]+',
-                    r'medium\.com/[^/\s]+'
-                ]
-            }
-            
             # Find all links on the page
             all_links = soup.find_all('a', href=True)
             
@@ -112,85 +416,88 @@ class BusinessIntelligenceAnalyzer(BaseAgent):
             
             for link in all_links:
                 href = link.get('href', '').lower()
+                # Most links are internal ('/about', '#top'); a few substring
+                # tests reject them far faster than the regex can
+                if not any(token in href for token in _SOCIAL_DOMAIN_TOKENS):
+                    continue
                 link_text = link.get_text().strip().lower()
                 
-                # Check if it's a social media link
-                for platform, patterns in social_patterns.items():
-                    for pattern in patterns:
-                        if re.search(pattern, href, re.IGNORECASE):
-                            # Extract the username/handle
-                            match = re.search(pattern, href, re.IGNORECASE)
-                            if match:
-                                username = match.group(0)
-                                
-                                # Clean up the username
-                                if platform == 'facebook' and '/pages/' in username:
-                                    username = username.split('/pages/')[-1]
-                                elif platform == 'linkedin' and '/company/' in username:
-                                    username = username.split('/company/')[-1]
-                                elif platform == 'linkedin' and '/in/' in username:
-                                    username = username.split('/in/')[-1]
-                                elif platform == 'youtube' and '/channel/' in username:
-                                    username = username.split('/channel/')[-1]
-                                elif platform == 'youtube' and '/c/' in username:
-                                    username = username.split('/c/')[-1]
-                                elif platform == 'youtube' and '/user/' in username:
-                                    username = username.split('/user/')[-1]
-                                elif platform == 'youtube' and '/@' in username:
-                                    username = username.split('/@')[-1]
-                                elif platform == 'tiktok' and '/@' in username:
-                                    username = username.split('/@')[-1]
-                                elif platform == 'snapchat' and '/add/' in username:
-                                    username = username.split('/add/')[-1]
-                                elif platform == 'whatsapp' and '/send?phone=' in username:
-                                    username = username.split('/send?phone=')[-1]
-                                elif platform == 'telegram' and '/me/' in username:
-                                    username = username.split('/me/')[-1]
-                                elif platform == 'discord' and '/gg/' in username:
-                                    username = username.split('/gg/')[-1]
-                                elif platform == 'discord' and '/invite/' in username:
-                                    username = username.split('/invite/')[-1]
-                                elif platform == 'reddit' and '/r/' in username:
-                                    username = username.split('/r/')[-1]
-                                elif platform == 'reddit' and '/u/' in username:
-                                    username = username.split('/u/')[-1]
-                                elif platform == 'medium' and '/@' in username:
-                                    username = username.split('/@')[-1]
-                                
-                                # Create social media account entry
-                                if platform not in found_platforms:
-                                    social_media_accounts.append({
-                                        'platform': platform.title(),
-                                        'url': href,
-                                        'username': username,
-                                        'handle': f"@{username}" if not username.startswith('@') else username,
-                                        'verified': False,  # Could be enhanced with verification detection
-                                        'followers': None,  # Could be enhanced with follower count extraction
-                                        'description': f"{platform.title()} profile"
-                                    })
-                                    found_platforms.add(platform)
-                                    break
+                # Check if it's a social media link; one scan finds the
+                # first platform (in _SOCIAL_PATTERN_SOURCES order) it matches
+                match = _SOCIAL_LINK_RE.match(href)
+                if match:
+                    platform = match.lastgroup
+                    # Extract the username/handle
+                    username = match.group(platform)
+                    
+                    # Clean up the username
+                    if platform == 'facebook' and '/pages/' in username:
+                        username = username.split('/pages/')[-1]
+                    elif platform == 'linkedin' and '/company/' in username:
+                        username = username.split('/company/')[-1]
+                    elif platform == 'linkedin' and '/in/' in username:
+                        username = username.split('/in/')[-1]
+                    elif platform == 'youtube' and '/channel/' in username:
+                        username = username.split('/channel/')[-1]
+                    elif platform == 'youtube' and '/c/' in username:
+                        username = username.split('/c/')[-1]
+                    elif platform == 'youtube' and '/user/' in username:
+                        username = username.split('/user/')[-1]
+                    elif platform == 'youtube' and '/@' in username:
+                        username = username.split('/@')[-1]
+                    elif platform == 'tiktok' and '/@' in username:
+                        username = username.split('/@')[-1]
+                    elif platform == 'snapchat' and '/add/' in username:
+                        username = username.split('/add/')[-1]
+                    elif platform == 'whatsapp' and '/send?phone=' in username:
+                        username = username.split('/send?phone=')[-1]
+                    elif platform == 'telegram' and '/me/' in username:
+                        username = username.split('/me/')[-1]
+                    elif platform == 'discord' and '/gg/' in username:
+                        username = username.split('/gg/')[-1]
+                    elif platform == 'discord' and '/invite/' in username:
+                        username = username.split('/invite/')[-1]
+                    elif platform == 'reddit' and '/r/' in username:
+                        username = username.split('/r/')[-1]
+                    elif platform == 'reddit' and '/u/' in username:
+                        username = username.split('/u/')[-1]
+                    elif platform == 'medium' and '/@' in username:
+                        username = username.split('/@')[-1]
+                    
+                    # Create social media account entry
+                    if platform not in found_platforms:
+                        social_media_accounts.append({
+                            'platform': platform.title(),
+                            'url': href,
+                            'username': username,
+                            'handle': f"@{username}" if not username.startswith('@') else username,
+                            'verified': False,  # Could be enhanced with verification detection
+                            'followers': None,  # Could be enhanced with follower count extraction
+                            'description': f"{platform.title()} profile"
+                        })
+                        found_platforms.add(platform)
+                        # Nothing left to find once every platform has a link
+                        if len(found_platforms) == len(_SOCIAL_PATTERN_SOURCES):
+                            break
             
             # Also check for social media icons with data attributes or classes
-            social_icons = soup.find_all(['a', 'div', 'span'], class_=lambda x: x and any(
-                term in x.lower() for term in ['social', 'facebook', 'twitter', 'instagram', 'linkedin', 'youtube', 'tiktok']
-            ))
+            social_icons = soup.find_all(['a', 'div', 'span'], class_=_SOCIAL_ICON_CLASS_RE)
             
             for icon in social_icons:
                 href = icon.get('href', '')
-                if href and any(platform in href.lower() for platform in social_patterns.keys()):
+                if href and any(platform in href.lower() for platform in _SOCIAL_PATTERN_SOURCES):
                     # This is already covered by the link extraction above
                     continue
             
             # Check meta tags for social media information
-            meta_tags = soup.find_all('meta', property=lambda x: x and 'og:' in x)
+            meta_tags = soup.find_all('meta', property=_OG_PROPERTY_RE)
             for meta in meta_tags:
                 property_name = meta.get('property', '')
                 content = meta.get('content', '')
                 
-                if 'og:url' in property_name and any(platform in content.lower() for platform in social_patterns.keys()):
+                if 'og:url' in property_name and any(platform in content.lower() for platform in _SOCIAL_PATTERN_SOURCES):
                     # Extract platform from URL
-                    for platform in social_patterns.keys():
+                    for platform in _SOCIAL_PATTERN_SOURCES:
                         if platform in content.lower():
                             if platform not in found_platforms:
                                 social_media_accounts.append({
@@ -212,42 +519,22 @@ class BusinessIntelligenceAnalyzer(BaseAgent):
             self.logger.error(f"Error extracting social media links: {e}")
             return []
 
-    def fetch_website_content(self, url: str) -> str:
-        """Fetch and clean website content."""
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Connection': 'keep-alive'
-        }
-
-        self.logger.info(f"Fetching content from {url}")
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-
-            # Parse and clean HTML to extract meaningful content
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # Remove script, style, and other non-content tags
-            for tag in soup(['script', 'style', 'noscript', 'iframe', 'svg']):
-                tag.decompose()
-
-            # Extract text content with some structure preserved
-            text_content = soup.get_text(separator='\n', strip=True)
-
-            # Also extract meta tags for additional context
-            meta_description = soup.find('meta', attrs={'name': 'description'})
-            meta_desc = meta_description.get('content', '') if meta_description else ''
+    def fetch_website_content(self, url: str, html: Optional[str] = None) -> str:
+        """
+        Fetch and clean website content.
 
-            meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-            meta_keys = meta_keywords.get('content', '') if meta_keywords else ''
+        Pass the homepage HTML already fetched by fetch_homepage to skip the request.
+        """
+        if html is None:
+            html = self.fetch_homepage(url)
 
-            title = soup.find('title')
-            title_text = title.get_text().strip() if title else ''
+        # Extract text content with some structure preserved, skipping
+        # script, style, and other non-content tags, plus title and meta
+        # tags for additional context
+        title_text, meta_desc, meta_keys, text_content = _summarize_html(html)
 
-            # Combine structured information
-            structured_content = f"""Website Title: {title_text}
+        # Combine structured information
+        structured_content = f"""Website Title: {title_text}
 
 Meta Description: {meta_desc}
 
@@ -256,19 +543,77 @@ Meta Keywords: {meta_keys}
 Website Content:
 {text_content[:15000]}"""  # Send first 15000 chars of clean text
 
-            self.logger.info(f"Extracted {len(text_content)} characters of content from {url}")
-            return structured_content
+        self.logger.info(f"Extracted {len(text_content)} characters of content from {url}")
+        return structured_content
 
+    def fetch_homepage(self, url: str) -> str:
+        """Fetch a page's HTML once so several extractors can share it."""
+        self.logger.info(f"Fetching content from {url}")
+        try:
+            # The shared session carries the browser headers and keeps the
+            # connection alive for the About-page and social-link fetches
+            html = self._conditional_get(url, timeout=30)
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Request failed for {url}: {e}")
             raise
+        # The homepage often turns up again among the About pages
+        self._remember_html(url, html)
+        return html
+
+    def _conditional_get(self, url: str, timeout: int = 30) -> str:
+        """
+        GET a page's HTML, revalidating a cached copy with If-None-Match/If-Modified-Since.
+
+        A 304 answer is served from the copy stored under metrics/cache/http;
+        a fresh 200 carrying an ETag or Last-Modified replaces it. Raises
+        requests.HTTPError for error statuses like session.get + raise_for_status.
+        """
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        meta_path = self.http_cache_dir / f"{key}.json"
+        body_path = self.http_cache_dir / f"{key}.html"
+
+        headers = {}
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+        except (OSError, ValueError):
+            pass
+
+        response = self.session.get(url, headers=headers, timeout=timeout, stream=True)
+        if response.status_code == 304 and headers:
+            response.close()
+            try:
+                self.logger.info(f"Not modified, using cached copy of {url}")
+                return body_path.read_text(encoding='utf-8')
+            except OSError:
+                # Cached body vanished; fetch it again unconditionally
+                response = self.session.get(url, timeout=timeout, stream=True)
+        try:
+            response.raise_for_status()
+            html = _read_html_prefix(response)
+        finally:
+            response.close()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            try:
+                self.ensure_dir(self.http_cache_dir)
+                body_path.write_text(html, encoding='utf-8')
+                meta_path.write_text(json.dumps({'url': url, 'etag': etag, 'last_modified': last_modified}), encoding='utf-8')
+            except OSError as e:
+                self.logger.warning(f"Could not cache {url}: {e}")
+        return html
 
-    def find_about_pages(self, base_url: str) -> List[str]:
+    def find_about_pages(self, base_url: str, homepage_soup: Optional[BeautifulSoup] = None) -> List[str]:
         """
         Find About/About Me pages by checking homepage and navigation.
         
         Args:
             base_url: The base website URL
+            homepage_soup: Already-parsed homepage; fetched when omitted
             
         Returns:
             List of About page URLs found
@@ -278,7 +623,8 @@ Website Content:
         try:
             # First, check the homepage for About sections
             self.logger.info(f"Checking homepage for About sections: {base_url}")
-            homepage_soup = self._fetch_and_parse(base_url)
+            if homepage_soup is None:
+                homepage_soup = self._fetch_and_parse(base_url)
             
             if homepage_soup:
                 # Check if this is a JavaScript SPA
@@ -327,7 +673,7 @@ Website Content:
             # Very minimal content (likely SPA)
             if len(page_text) < 200:
                 # Check for empty root element (React/Vue/Angular)
-                root_elements = soup.find_all(['div', 'main', 'app'], id=lambda x: x and x.lower() in ['root', 'app', 'main'])
+                root_elements = soup.find_all(['div', 'main', 'app'], id=_SPA_ROOT_ID_RE)
                 for root in root_elements:
                     if not root.get_text().strip():
                         self.logger.warning(f"Detected JavaScript SPA at {url} - content loaded dynamically")
@@ -352,60 +698,77 @@ Website Content:
             self.logger.error(f"Error detecting SPA: {e}")
             return False
 
-    def _fetch_and_parse(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a URL, returning BeautifulSoup object."""
+    def _fetch_and_parse(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """Fetch and parse a URL, returning BeautifulSoup object (of just the parse_only elements if given)."""
+        html = self._fetch_html(url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, _HTML_PARSER, parse_only=parse_only)
+
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page's HTML, or None when it is blocked or the request fails."""
         try:
-            response = self.session.get(url, timeout=30)
-            
-            # Check for Cloudflare protection or other blocking
-            if response.status_code == 403:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                page_text = soup.get_text().lower()
-                if 'cloudflare' in page_text or 'just a moment' in page_text or 'enable javascript' in page_text:
-                    self.logger.warning(f"Cloudflare protection detected at {url} - content blocked")
-                    return None
-            
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            html = self._recent_html(url)
+            if html is None:
+                # Streamed so a huge page is read only up to _MAX_HTML_BYTES
+                response = self.session.get(url, timeout=30, stream=True)
+                try:
+                    # Check for Cloudflare protection or other blocking
+                    if response.status_code == 403:
+                        soup = BeautifulSoup(_read_html_prefix(response), _HTML_PARSER)
+                        page_text = soup.get_text().lower()
+                        if 'cloudflare' in page_text or 'just a moment' in page_text or 'enable javascript' in page_text:
+                            self.logger.warning(f"Cloudflare protection detected at {url} - content blocked")
+                            return None
+                    
+                    response.raise_for_status()
+                    html = _read_html_prefix(response)
+                finally:
+                    response.close()
+                self._remember_html(url, html)
+            return html
         except Exception as e:
             self.logger.warning(f"Failed to fetch {url}: {e}")
             return None
 
+    def _recent_html(self, url: str) -> Optional[str]:
+        """HTML fetched for url within the last _HTML_MEMO_TTL seconds, if any."""
+        with self._html_memo_lock:
+            entry = self._html_memo.get(url)
+            if entry is None:
+                return None
+            fetched_at, html = entry
+            if time.monotonic() - fetched_at >= _HTML_MEMO_TTL:
+                del self._html_memo[url]
+                return None
+            self._html_memo.move_to_end(url)
+            return html
+
+    def _remember_html(self, url: str, html: str) -> None:
+        with self._html_memo_lock:
+            self._html_memo[url] = (time.monotonic(), html)
+            self._html_memo.move_to_end(url)
+            while len(self._html_memo) > _HTML_MEMO_SIZE:
+                self._html_memo.popitem(last=False)
+
     def _find_about_sections_on_page(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Find About sections directly on the current page."""
         about_sections = []
         
         # First, check if the homepage itself contains substantial founder information
         page_text = soup.get_text(separator=' ', strip=True)
-        founder_keywords = [
-            'founder', 'co-founder', 'ceo', 'cto', 'president', 'director',
-            'about the founder', 'meet the founder', 'our founder',
-            'leadership', 'team', 'about us', 'our story', 'about me',
-            'owner', 'creator', 'started', 'began', 'established',
-            'my name is', 'i am', 'i founded', 'i started'
-        ]
         
         # Check if the page contains founder-related content
-        if any(keyword in page_text.lower() for keyword in founder_keywords):
+        if _mentions_founder(page_text.lower()):
             about_sections.append(base_url)
             self.logger.info(f"Homepage contains founder information: {base_url}")
         
-        # Look for About sections by common patterns
-        about_patterns = [
-            r'about\s+(?:us|me|the\s+founder|the\s+team)',
-            r'our\s+story',
-            r'meet\s+the\s+founder',
-            r'founder\'?s?\s+story',
-            r'leadership',
-            r'team'
-        ]
-        
         # Check headings and sections
-        for pattern in about_patterns:
+        heading_texts = [heading.get_text().lower() for heading in soup.find_all(_HEADING_TAGS)]
+        for pattern in _ABOUT_HEADING_PATTERNS:
             # Look in headings
-            headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            for heading in headings:
-                if heading.get_text() and re.search(pattern, heading.get_text(), re.IGNORECASE):
+            for heading_text in heading_texts:
+                if heading_text and pattern.search(heading_text):
                     # Found an About section on this page
                     if base_url not in about_sections:
                         about_sections.append(base_url)
@@ -420,96 +783,30 @@ Website Content:
         """Find About page links in navigation menus and footer."""
         about_pages = []
         
-        # Common About page link patterns (multilingual support)
-        about_link_patterns = [
-            # English
-            r'about', r'about-us', r'about-me', r'our-story', r'team', r'leadership', r'founder', r'meet-the-team',
-            # Danish - more specific patterns
-            r'^om$', r'om-os', r'om-mig', r'vores-historie', r'hold', r'ledelse', r'om-universal', r'om-',
-            # French
-            r'à-propos', r'à-propos-de-nous', r'à-propos-de-moi', r'notre-histoire', r'équipe', r'direction',
-            # German
-            r'über', r'über-uns', r'über-mich', r'unser-geschichte', r'team', r'führung',
-            # Spanish
-            r'acerca-de', r'sobre-nosotros', r'sobre-mí', r'nuestra-historia', r'equipo', r'liderazgo',
-            # Italian
-            r'chi-siamo', r'su-di-noi', r'su-di-me', r'la-nostra-storia', r'squadra', r'leadership',
-            # Portuguese
-            r'sobre', r'sobre-nós', r'sobre-mim', r'nossa-história', r'equipe', r'liderança',
-            # Dutch
-            r'over', r'over-ons', r'over-mij', r'ons-verhaal', r'team', r'leiderschap',
-            # Swedish - more specific patterns
-            r'^om$', r'om-oss', r'om-mig', r'vår-historia', r'team', r'ledning', r'om-',
-            # Norwegian - more specific patterns
-            r'^om$', r'om-oss', r'om-meg', r'vår-historie', r'team', r'ledelse', r'om-',
-            # Finnish
-            r'tietoa', r'tietoa-meistä', r'tietoa-minusta', r'tarinamme', r'tiimi', r'johto'
-        ]
-        
-        # Look in navigation elements (header, nav, main menu, mega menus)
-        nav_selectors = [
-            'nav', 'header', '.nav', '.navigation', '.menu', '.header',
-            '[role="navigation"]', '.navbar', '.main-nav', '.top-nav',
-            # Mega menu and dropdown selectors
-            '.mega-menu', '.dropdown', '.submenu', '.sub-menu', '.mega-nav',
-            '.dropdown-menu', '.nav-dropdown', '.menu-dropdown', '.mega-dropdown',
-            '.nav-item', '.menu-item', '.nav-link', '.menu-link'
-        ]
-        
-        # Look in footer elements
-        footer_selectors = [
-            'footer', '.footer', '#footer', '.site-footer', '.page-footer'
-        ]
-        
-        # Search in navigation elements
-        for selector in nav_selectors:
-            nav_elements = soup.select(selector)
-            for nav in nav_elements:
-                links = nav.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    link_text = link.get_text().strip().lower()
-                    
-                    # Check if link text matches About patterns
-                    for pattern in about_link_patterns:
-                        if re.search(pattern, link_text, re.IGNORECASE):
-                            full_url = urljoin(base_url, href)
-                            if self._is_same_domain(full_url, base_url):
-                                about_pages.append(full_url)
-                                break
-                    
-                    # Also check href for About patterns
-                    for pattern in about_link_patterns:
-                        if re.search(pattern, href, re.IGNORECASE):
-                            full_url = urljoin(base_url, href)
-                            if self._is_same_domain(full_url, base_url):
-                                about_pages.append(full_url)
-                                break
-        
-        # Search in footer elements
-        for selector in footer_selectors:
-            footer_elements = soup.select(selector)
-            for footer in footer_elements:
-                links = footer.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href', '')
-                    link_text = link.get_text().strip().lower()
-                    
-                    # Check if link text matches About patterns
-                    for pattern in about_link_patterns:
-                        if re.search(pattern, link_text, re.IGNORECASE):
-                            full_url = urljoin(base_url, href)
-                            if self._is_same_domain(full_url, base_url):
-                                about_pages.append(full_url)
-                                break
-                    
-                    # Also check href for About patterns
-                    for pattern in about_link_patterns:
-                        if re.search(pattern, href, re.IGNORECASE):
-                            full_url = urljoin(base_url, href)
-                            if self._is_same_domain(full_url, base_url):
-                                about_pages.append(full_url)
-                                break
+        # Navigation containers first, then footer ones, each in document order
+        containers = _NAV_SELECTOR.select(soup) + _FOOTER_SELECTOR.select(soup)
+        for container in containers:
+            links = container.find_all('a', href=True)
+            for link in links:
+                href = link.get('href', '')
+                href_lower = href.lower()
+                link_text = link.get_text().strip().lower()
+                
+                # Check if link text matches About patterns
+                for pattern in _ABOUT_LINK_PATTERNS:
+                    if pattern.search(link_text):
+                        full_url = urljoin(base_url, href)
+                        if self._is_same_domain(full_url, base_url):
+                            about_pages.append(full_url)
+                            break
+                
+                # Also check href for About patterns
+                for pattern in _ABOUT_LINK_PATTERNS:
+                    if pattern.search(href_lower):
+                        full_url = urljoin(base_url, href)
+                        if self._is_same_domain(full_url, base_url):
+                            about_pages.append(full_url)
+                            break
         
         return about_pages
 
@@ -571,8 +868,10 @@ Website Content:
                 'tietoa', 'perustaja', 'tiimi', 'johto'
             ]
             
-            for pattern in about_id_patterns:
-                elements = soup.find_all(id=lambda x: x and pattern in x.lower())
+            # One tree walk collects every id; each pattern then filters the list
+            id_elements = [(element, element['id'].lower()) for element in soup.find_all(id=True)]
+            for pattern in dict.fromkeys(about_id_patterns):
+                elements = [element for element, element_id in id_elements if pattern in element_id]
                 for element in elements:
                     section_text = element.get_text(separator=' ', strip=True)
                     if len(section_text) > 100:  # Only consider sections with substantial content
@@ -607,10 +906,18 @@ Website Content:
         """
         founders = []
         
-        for about_url in about_pages:
+        # The downloads are independent and network-bound, so they run
+        # concurrently over the pooled session; parsing and extraction stay
+        # on this thread, in page order
+        pages_html = []
+        if about_pages:
+            with ThreadPoolExecutor(max_workers=min(8, len(about_pages))) as executor:
+                pages_html = list(executor.map(self._fetch_html, about_pages))
+        
+        for about_url, html in zip(about_pages, pages_html):
             try:
                 self.logger.info(f"Extracting founder details from: {about_url}")
-                soup = self._fetch_and_parse(about_url)
+                soup = BeautifulSoup(html, _HTML_PARSER) if html is not None else None
                 
                 if not soup:
                     continue
@@ -730,7 +1037,7 @@ Website Content:
         ]
         
         # Check headings and their following content
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = soup.find_all(_HEADING_TAGS)
         
         for heading in headings:
             heading_text = heading.get_text().strip().lower()
@@ -753,7 +1060,7 @@ Website Content:
         ]
         
         for selector in founder_selectors:
-            sections = soup.select(selector)
+            sections = _select(soup, selector)
             founder_sections.extend(sections)
         
         # Look for main content areas that might contain founder info
@@ -763,7 +1070,7 @@ Website Content:
         ]
         
         for selector in main_content_selectors:
-            sections = soup.select(selector)
+            sections = _select(soup, selector)
             for section in sections:
                 # Check if this section contains founder-related keywords
                 section_text = section.get_text().lower()
@@ -798,7 +1105,7 @@ Website Content:
         # Create a new soup object with just this section
         if content_elements:
             section_html = ''.join(str(elem) for elem in content_elements)
-            return BeautifulSoup(section_html, 'html.parser')
+            return BeautifulSoup(section_html, _HTML_PARSER)
         
         return None
 
@@ -809,7 +1116,7 @@ Website Content:
             text_content = section.get_text(separator=' ', strip=True)
             
             self.logger.info(f"Extracted text content length: {len(text_content)} characters")
-            self.logger.debug(f"First 500 characters of content: {text_content[:500]}")
+            self.logger.debug("First 500 characters of content: %.500s", text_content)
             
             if len(text_content) < 50:  # Too short to be meaningful
                 self.logger.warning(f"Content too short ({len(text_content)} chars), skipping")
@@ -842,8 +1149,10 @@ IMPORTANT: Follow the instructions in the founder_extractor.md file exactly. Ext
             )
             
             # Parse AI response
-            self.logger.info(f"AI response type: {type(ai_response)}")
-            self.logger.info(f"AI response content: {str(ai_response)[:1000]}")
+            # Lazy %-formatting: the (possibly large) response is only
+            # stringified and truncated when debug logging is enabled
+            self.logger.debug("AI response type: %s", type(ai_response))
+            self.logger.debug("AI response content: %.1000s", ai_response)
             
             if isinstance(ai_response, dict):
                 # AI returned a dictionary directly
@@ -866,7 +1175,6 @@ IMPORTANT: Follow the instructions in the founder_extractor.md file exactly. Ext
                     json_end = analysis_text.rfind('}') + 1
                     if json_start != -1 and json_end > json_start:
                         json_str = analysis_text[json_start:json_end]
-                        import json
                         try:
                             extracted_data = json.loads(json_str)
                             # Check if this contains founder information
@@ -885,7 +1193,6 @@ IMPORTANT: Follow the instructions in the founder_extractor.md file exactly. Ext
                 json_end = ai_response.rfind('}') + 1
                 if json_start != -1 and json_end > json_start:
                     json_str = ai_response[json_start:json_end]
-                    import json
                     try:
                         founder_data = json.loads(json_str)
                         if founder_data and founder_data.get('name'):
@@ -895,7 +1202,7 @@ IMPORTANT: Follow the instructions in the founder_extractor.md file exactly. Ext
                             self.logger.warning(f"No founder name found in AI response for {page_url}")
                     except json.JSONDecodeError as e:
                         self.logger.error(f"JSON decode error in founder extraction: {e}")
-                        self.logger.debug(f"AI response: {ai_response}")
+                        self.logger.debug("AI response: %s", ai_response)
             else:
                 self.logger.warning(f"Unexpected AI response type: {type(ai_response)}")
             
@@ -972,7 +1279,6 @@ Follow the instructions in the founder_extractor.md file exactly and return the
                 json_end = ai_response.rfind('}') + 1
                 if json_start != -1 and json_end > json_start:
                     json_str = ai_response[json_start:json_end]
-                    import json
                     try:
                         founder_data = json.loads(json_str)
                         if founder_data and founder_data.get('name'):
@@ -1004,7 +1310,7 @@ Follow the instructions in the founder_extractor.md file exactly and return the
             
             # Try to find main content areas
             for selector in main_content_selectors:
-                elements = soup.select(selector)
+                elements = _select(soup, selector)
                 for element in elements:
                     element_text = element.get_text(separator=' ', strip=True)
                     if len(element_text) > 100:  # Only consider substantial content
@@ -1088,7 +1394,7 @@ Follow the instructions in the founder_extractor.md file exactly and return the
                 main_content = main_content[:4000]
             
             self.logger.info(f"Extracted main content for founder analysis: {len(main_content)} characters")
-            self.logger.debug(f"Main content preview: {main_content[:500]}")
+            self.logger.debug("Main content preview: %.500s", main_content)
             
             return main_content
             
@@ -1109,8 +1415,11 @@ Follow the instructions in the founder_extractor.md file exactly and return the
         Returns:
             Business intelligence analysis data saved to JSON file
         """
-        # Step 1: Fetch website content (existing functionality)
-        html_content = self.fetch_website_content(url)
+        # Step 1: Fetch website content (existing functionality). The homepage
+        # is fetched once; its parsed tree feeds the About-page and social scans.
+        homepage_html = self.fetch_homepage(url)
+        html_content = self.fetch_website_content(url, html=homepage_html)
+        homepage_soup = BeautifulSoup(homepage_html, _HTML_PARSER)
 
         # Step 2: Load instructions from markdown file (existing functionality)
         agent_name = prompt_file or self.name
@@ -1119,20 +1428,17 @@ Follow the instructions in the founder_extractor.md file exactly and return the
         if not instructions:
             raise ValueError(f"Failed to load instructions from {agent_name}.md")
 
-        # Step 3: Send to AI with instructions and HTML content (existing functionality)
-        business_intel = self.ai_provider.analyze_website(html_content, url, agent_name=agent_name)
+        # Step 3: Send to AI with instructions and HTML content (existing functionality).
+        # The analysis runs on a worker thread so its round trip overlaps the
+        # About-page and social-link scraping below; it is joined before merging.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            analysis_future = executor.submit(self._cached_analyze_website, html_content, url, agent_name)
+            enhanced_founders, social_media_accounts = self._scrape_founders_and_socials(url, homepage_soup)
+            business_intel = analysis_future.result()
 
         # Step 4: Enhanced founder details extraction (NEW FUNCTIONALITY)
-        self.logger.info("Starting enhanced founder details extraction...")
-        
-        try:
-            # Find About pages
-            about_pages = self.find_about_pages(url)
-            
-            if about_pages:
-                # Extract detailed founder information
-                enhanced_founders = self.extract_founder_details(about_pages)
-                
+        if enhanced_founders is not None:
+            try:
                 # Merge with existing founder data if any
                 existing_founders = business_intel.get('founders', [])
                 
@@ -1143,28 +1449,16 @@ Follow the instructions in the founder_extractor.md file exactly and return the
                 # Note: Founder details are included in the main business intelligence JSON file
                 
                 self.logger.info(f"Enhanced founder extraction completed. Found {len(all_founders)} founders total.")
-            else:
-                self.logger.info("No About pages found for enhanced founder extraction.")
-                
-        except Exception as e:
-            self.logger.error(f"Error in enhanced founder extraction: {e}")
-            # Continue with existing data if enhancement fails
+            except Exception as e:
+                self.logger.error(f"Error in enhanced founder extraction: {e}")
+                # Continue with existing data if enhancement fails
 
         # Step 5: Social media links extraction (NEW FUNCTIONALITY)
-        self.logger.info("Starting social media links extraction...")
-        
-        try:
-            # Extract social media links
-            social_media_accounts = self.extract_social_media_links(url)
-            
+        if social_media_accounts is not None:
             # Replace the existing socialMediaAccounts with detailed extraction
             business_intel['socialMediaAccounts'] = social_media_accounts
             business_intel['enhanced_social_media_extraction'] = True
-            
-            self.logger.info(f"Social media extraction completed. Found {len(social_media_accounts)} social media accounts.")
-            
-        except Exception as e:
-            self.logger.error(f"Error in social media extraction: {e}")
+        else:
             business_intel['enhanced_social_media_extraction'] = False
 
         # Step 6: Add metadata (existing functionality)
@@ -1179,11 +1473,86 @@ Follow the instructions in the founder_extractor.md file exactly and return the
         # Step 6: Save to metrics/companies/{domain-name}-business-intelligence-{date}.json (existing functionality)
         domain = self.sanitize_domain(url)
         filename = self.get_output_filename(domain)
-        self.save_json(business_intel, filename, "companies")
+        # Write a snapshot in the background so the caller can move on while
+        # the file lands, and later edits to the returned dict are not saved
+        save_future = self._io_pool.submit(self.save_json, copy.deepcopy(business_intel), filename, "companies")
+        save_future.add_done_callback(self._log_save_failure)
 
-        self.logger.info(f"Enhanced business intelligence saved to metrics/companies/{filename}")
+        self.logger.info(f"Enhanced business intelligence queued for metrics/companies/{filename}")
         return business_intel
 
+    def _log_save_failure(self, future) -> None:
+        error = future.exception()
+        if error is not None:
+            self.logger.error(f"Error saving business intelligence: {error}")
+
+    def _cached_analyze_website(self, html_content: str, url: str, agent_name: str) -> Dict[str, Any]:
+        """
+        analyze_website, memoised on disk for _AI_CACHE_TTL seconds.
+
+        The key hashes the provider, model, agent prompt name and page content,
+        so a rerun over an unchanged page skips the round trip and its token cost.
+        Replies the provider could not parse (parsing_error) are never cached,
+        so a malformed answer is retried on the next run.
+        """
+        key_source = "\x00".join((self.ai_provider.name, str(self.ai_provider.model), agent_name, html_content))
+        cache_path = self.ai_cache_dir / f"{hashlib.sha256(key_source.encode('utf-8')).hexdigest()}.json"
+
+        try:
+            if time.time() - cache_path.stat().st_mtime < _AI_CACHE_TTL:
+                cached = json.loads(cache_path.read_text(encoding='utf-8'))
+                if _is_cacheable_analysis(cached):
+                    self.logger.info(f"Using cached website analysis for {url}")
+                    return cached
+        except (OSError, ValueError):
+            pass
+
+        result = self.ai_provider.analyze_website(html_content, url, agent_name=agent_name)
+        if not _is_cacheable_analysis(result):
+            return result
+
+        try:
+            self.ensure_dir(self.ai_cache_dir)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(result, ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Could not cache website analysis for {url}: {e}")
+        return result
+
+    def _scrape_founders_and_socials(self, url: str, homepage_soup: Optional[BeautifulSoup] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[List[Dict[str, Any]]]]:
+        """
+        Run the page-scraping half of process(): About-page founders and social links.
+
+        Returns (enhanced_founders, social_media_accounts); either is None when
+        that step found nothing to merge or failed.
+        """
+        enhanced_founders = None
+        social_media_accounts = None
+
+        self.logger.info("Starting enhanced founder details extraction...")
+        try:
+            # Find About pages
+            about_pages = self.find_about_pages(url, homepage_soup)
+
+            if about_pages:
+                # Extract detailed founder information
+                enhanced_founders = self.extract_founder_details(about_pages)
+            else:
+                self.logger.info("No About pages found for enhanced founder extraction.")
+        except Exception as e:
+            self.logger.error(f"Error in enhanced founder extraction: {e}")
+
+        self.logger.info("Starting social media links extraction...")
+        try:
+            social_media_accounts = self.extract_social_media_links(url, homepage_soup)
+            self.logger.info(f"Social media extraction completed. Found {len(social_media_accounts)} social media accounts.")
+        except Exception as e:
+            self.logger.error(f"Error in social media extraction: {e}")
+
+        return enhanced_founders, social_media_accounts
+
     def _merge_founder_data(self, existing_founders: List[Dict[str, Any]], enhanced_founders: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Merge existing founder data with enhanced founder data, avoiding duplicates.
@@ -1241,7 +1610,7 @@ Follow the instructions in the founder_extractor.md file exactly and return the
                     try:
                         response = self.session.get(url, timeout=10)
                         if response.status_code == 403:
-                            soup = BeautifulSoup(response.text, 'html.parser')
+                            soup = BeautifulSoup(_decode_html(response.content, response.encoding), _HTML_PARSER)
                             page_text = soup.get_text().lower()
                             if 'cloudflare' in page_text or 'just a moment' in page_text:
                                 return {"error": "Cloudflare protection detected - website blocked", "founders": []}
@@ -22,6 +22,13 @@ class FacebookScraper(BaseAgent):
         self.api_key = os.getenv("BRIGHT_DATA_API_KEY")
         self.dataset_id = os.getenv("BRIGHT_DATA_DATASET_ID")
         self.base_url = "https://api.brightdata.com/datasets/v3"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # One keep-alive session for the trigger, progress polls and download
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
         
         if not self.api_key:
             self.logger.warning("BRIGHT_DATA_API_KEY not found in environment variables")
@@ -40,13 +47,6 @@ class FacebookScraper(BaseAgent):
         
         return start_date, end_date
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for Bright Data API requests."""
-        return {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-    
     def trigger_data_collection(self, facebook_url: str, num_posts: int = 5) -> Optional[str]:
         """
         Step 1: Trigger data collection API.
@@ -78,9 +78,8 @@ class FacebookScraper(BaseAgent):
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 url,
-                headers=self._get_headers(),
                 json=payload,
                 params=params,
                 timeout=30
@@ -127,7 +126,7 @@ class FacebookScraper(BaseAgent):
         
         while time.time() - start_time < max_wait_time:
             try:
-                response = requests.get(url, headers=self._get_headers(), timeout=30)
+                response = self.session.get(url, timeout=30)
                 response.raise_for_status()
                 
                 result = response.json()
@@ -168,9 +167,8 @@ class FacebookScraper(BaseAgent):
         params = {"format": "json"}
         
         try:
-            response = requests.get(
+            response = self.session.get(
                 url,
-                headers=self._get_headers(),
                 params=params,
                 timeout=30
             )
@@ -1,6 +1,6 @@
 """Instagram prompt generator - creates Gemini-ready prompts for image generation."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
 from ai_providers.ai_factory import AIProviderFactory
 from ai_providers.base_provider import AICapability
@@ -8,9 +8,11 @@ from ai_providers.base_provider import AICapability
 class InstagramPromptGenerator(BaseAgent):
     """Generates detailed Gemini prompts for Instagram image creation."""
 
-    def __init__(self):
+    def __init__(self, ai_providers: Optional[Dict[str, str]] = None):
         super().__init__("instagram_prompt_generator", "metrics")
-        self.ai_provider = AIProviderFactory.get_configured_provider(AICapability.CONTENT_STRATEGY)
+        self.ai_provider = AIProviderFactory.get_configured_provider(
+            AICapability.CONTENT_STRATEGY, (ai_providers or {}).get(AICapability.CONTENT_STRATEGY.value)
+        )
 
     def process(self, url: str, social_content: Dict[str, Any] = None, prompt_file: str = None, **kwargs) -> Dict[str, Any]:
         """
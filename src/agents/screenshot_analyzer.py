@@ -1,28 +1,38 @@
 """Screenshot analyzer agent - captures and analyzes website screenshots."""
 
 import os
+import re
 import json
-from typing import Dict, Any
+from collections import Counter
+from typing import Dict, Any, Optional
+import requests
+from bs4 import BeautifulSoup
 from PIL import Image
 from .base_agent import BaseAgent
 from ai_providers.ai_factory import AIProviderFactory
 from ai_providers.base_provider import AICapability
 
+try:
+    import lxml
+except ImportError:  # Optional: fall back to bs4's pure-Python html.parser
+    lxml = None
+
+# The libxml2-backed lxml parser is several times faster than html.parser
+_HTML_PARSER = 'lxml' if lxml is not None else 'html.parser'
+
 class ScreenshotAnalyzer(BaseAgent):
     """Captures website screenshots and analyzes design style."""
 
-    def __init__(self):
+    def __init__(self, ai_providers: Optional[Dict[str, str]] = None):
         super().__init__("screenshot_analyzer", "metrics")
         self.screenshot_endpoint = os.getenv("SCREENSHOT_ENDPOINT")
         self.screenshot_api_key = os.getenv("SCREENSHOT_API_KEY")
-        self.ai_provider = AIProviderFactory.get_configured_provider(AICapability.WEB_ANALYSIS)
+        self.ai_provider = AIProviderFactory.get_configured_provider(
+            AICapability.WEB_ANALYSIS, (ai_providers or {}).get(AICapability.WEB_ANALYSIS.value)
+        )
 
     def extract_css_data(self, url: str) -> Dict[str, Any]:
         """Extract actual CSS colors and fonts from the webpage with frequency-based prioritization."""
-        import requests
-        from bs4 import BeautifulSoup
-        import re
-        from collections import Counter
 
         try:
             headers = {
@@ -30,7 +40,7 @@ class ScreenshotAnalyzer(BaseAgent):
             }
             response = requests.get(url, headers=headers, timeout=120)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, _HTML_PARSER)
 
             color_frequency = Counter()
             fonts = set()
@@ -147,7 +157,6 @@ class ScreenshotAnalyzer(BaseAgent):
 
     def capture_screenshot(self, url: str) -> str:
         """Capture screenshot using ScreenshotOne API and save to temp file."""
-        import requests
 
         temp_file = "/tmp/screenshot.png"
 
@@ -189,7 +198,6 @@ class ScreenshotAnalyzer(BaseAgent):
 
     def _compress_image_if_needed(self, image_path: str) -> str:
         """Compress image if it's too large for Claude API (5 MB base64 limit)."""
-        import base64
 
         # Check current size
         file_size = os.path.getsize(image_path)
@@ -1,6 +1,10 @@
 """Social media content creator agent - generates Instagram post concepts."""
 
-from typing import Dict, Any
+import os
+import re
+import glob
+import json
+from typing import Dict, Any, Optional
 from .base_agent import BaseAgent
 from ai_providers.ai_factory import AIProviderFactory
 from ai_providers.base_provider import AICapability
@@ -8,9 +12,11 @@ from ai_providers.base_provider import AICapability
 class SocialContentCreator(BaseAgent):
     """Creates Instagram post concepts based on business intelligence."""
 
-    def __init__(self):
+    def __init__(self, ai_providers: Optional[Dict[str, str]] = None):
         super().__init__("social_content_creator", "metrics")
-        self.ai_provider = AIProviderFactory.get_configured_provider(AICapability.CONTENT_STRATEGY)
+        self.ai_provider = AIProviderFactory.get_configured_provider(
+            AICapability.CONTENT_STRATEGY, (ai_providers or {}).get(AICapability.CONTENT_STRATEGY.value)
+        )
 
     def process(self, url: str, business_intel: Dict[str, Any] = None, design_analysis: Dict[str, Any] = None, facebook_posts: Dict[str, Any] = None, prompt_file: str = None, **kwargs) -> Dict[str, Any]:
         """
@@ -90,9 +96,6 @@ class SocialContentCreator(BaseAgent):
             facebook_posts_dir = f"metrics/facebook-posts/{domain}"
             
             # Look for the most recent Facebook posts file
-            import os
-            import glob
-            from pathlib import Path
             
             if os.path.exists(facebook_posts_dir):
                 pattern = f"{facebook_posts_dir}/*-facebook-posts-*.json"
@@ -102,7 +105,6 @@ class SocialContentCreator(BaseAgent):
                     latest_file = max(files, key=os.path.getctime)
                     self.logger.info(f"Loading Facebook posts from {latest_file}")
                     
-                    import json
                     with open(latest_file, 'r', encoding='utf-8') as f:
                         facebook_posts = json.load(f)
                     
@@ -212,7 +214,6 @@ class SocialContentCreator(BaseAgent):
                 analysis["content_lengths"].append(len(content))
             
             # Extract hashtags (simple regex for #hashtag pattern)
-            import re
             hashtags = re.findall(r'#\w+', content)
             analysis["hashtags_used"].update(hashtags)
             
@@ -16,18 +16,28 @@ class AIProviderFactory:
         "openai": OpenAIProvider
     }
     
+    # Providers hold no per-request state, so one instance per (name, model)
+    # is shared by every agent and request in the process
+    _instances: Dict[tuple, BaseAIProvider] = {}
+    
     @classmethod
     def create_provider(cls, provider_name: str, model: str = None) -> BaseAIProvider:
         """Create an AI provider instance."""
         if provider_name not in cls._providers:
             raise ValueError(f"Unknown provider: {provider_name}. Available: {list(cls._providers.keys())}")
         
-        provider_class = cls._providers[provider_name]
+        key = (provider_name, model)
+        provider = cls._instances.get(key)
+        if provider is None:
+            provider_class = cls._providers[provider_name]
+            
+            if model:
+                provider = provider_class(model)
+            else:
+                provider = provider_class()
+            cls._instances[key] = provider
         
-        if model:
-            return provider_class(model)
-        else:
-            return provider_class()
+        return provider
     
     @classmethod
     def get_default_provider(cls, capability: AICapability) -> BaseAIProvider:
@@ -60,8 +70,8 @@ class AIProviderFactory:
         raise ValueError(f"No available provider found for capability: {capability}")
     
     @classmethod
-    def get_configured_provider(cls, capability: AICapability) -> BaseAIProvider:
-        """Get provider based on environment configuration."""
+    def get_configured_provider(cls, capability: AICapability, preferred_provider: Optional[str] = None) -> BaseAIProvider:
+        """Get provider based on explicit preference, falling back to environment configuration."""
         # Force Gemini for image generation regardless of configuration
         if capability == AICapability.IMAGE_GENERATION:
             try:
@@ -77,7 +87,8 @@ class AIProviderFactory:
             AICapability.CONTENT_STRATEGY: os.getenv("AI_CONTENT_STRATEGY_PROVIDER", "claude")
         }
         
-        preferred_provider = provider_config.get(capability, "claude")
+        if not preferred_provider:
+            preferred_provider = provider_config.get(capability, "claude")
         
         try:
             provider = cls.create_provider(preferred_provider)
@@ -93,9 +104,9 @@ class AIProviderFactory:
         """List all available providers and their capabilities."""
         available = {}
         
-        for name, provider_class in cls._providers.items():
+        for name in cls._providers:
             try:
-                provider = provider_class()
+                provider = cls.create_provider(name)
                 available[name] = {
                     "model": provider.model,
                     "capabilities": [cap.value for cap in provider.capabilities],
@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from enum import Enum
+import requests
 
 class AICapability(Enum):
     """AI capabilities that providers can support."""
@@ -20,6 +21,9 @@ class BaseAIProvider(ABC):
         self.name = name
         self.model = model
         self.capabilities = self._get_capabilities()
+        # Providers are shared process-wide by AIProviderFactory, so every
+        # agent's API calls reuse this session's keep-alive connection pool
+        self.session = requests.Session()
     
     @abstractmethod
     def _get_capabilities(self) -> List[AICapability]:
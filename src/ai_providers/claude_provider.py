@@ -3,11 +3,21 @@
 import requests
 import json
 import os
+import re
+import io
+import time
+import random
+import base64
+import mimetypes
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+from prompt_loader import read_prompt
 from .base_provider import BaseAIProvider, AICapability
 
+# Embedded JSON objects (up to two levels of nesting) inside free-form replies
+_EMBEDDED_JSON_RE = re.compile(r'\{(?:[^{}]|(?:\{(?:[^{}]|\{[^{}]*\})*\}))*\}', re.DOTALL)
+
 class ClaudeProvider(BaseAIProvider):
     """Claude AI provider for text analysis and generation."""
     
@@ -15,6 +25,12 @@ class ClaudeProvider(BaseAIProvider):
         super().__init__("claude", model)
         self.api_key = self._get_api_key()
         self.base_url = "https://api.anthropic.com/v1/messages"
+        # Request headers are identical for every call; build them once
+        self.headers = {
+            "Content-Type": "application/json",
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01"
+        }
     
     def _get_api_key(self) -> str:
         """Get Claude API key from environment."""
@@ -35,22 +51,7 @@ class ClaudeProvider(BaseAIProvider):
             The prompt content as string, or None if file not found
         """
         try:
-            prompt_file = Path(prompts_dir) / f"{agent_name}.md"
-
-            if not prompt_file.exists():
-                return None
-
-            with open(prompt_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Remove YAML front matter if present (everything between --- lines)
-            if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    content = parts[2].strip()
-
-            return content
-
+            return read_prompt(agent_name, str(prompts_dir))
         except Exception:
             return None
     
@@ -65,13 +66,6 @@ class ClaudeProvider(BaseAIProvider):
     
     def _make_request(self, prompt: str, system_prompt: str = None, content: List = None, **kwargs) -> Dict[str, Any]:
         """Make request to Claude API with support for image content."""
-        import time
-
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01"
-        }
 
         # Use provided content or create text content from prompt
         if content:
@@ -92,7 +86,7 @@ class ClaudeProvider(BaseAIProvider):
         max_retries = 2  # Less retries for regular requests
         for attempt in range(max_retries):
             try:
-                response = requests.post(self.base_url, headers=headers, json=payload)
+                response = self.session.post(self.base_url, headers=self.headers, json=payload)
                 response.raise_for_status()
                 return response.json()
             except requests.exceptions.HTTPError as e:
@@ -151,8 +145,6 @@ Website Content:
 IMPORTANT: Analyze this ACTUAL website content thoroughly. Extract REAL information from the content provided above. Do not make assumptions or use placeholder data. Return only the JSON analysis object with accurate data extracted from the website content, no other text."""
 
         # Enhanced retry logic with exponential backoff and jitter
-        import time
-        import random
         max_retries = 6  # Increased retries for critical business analysis
         base_delay = 5  # Base delay in seconds
         last_exception = None
@@ -244,26 +236,16 @@ IMPORTANT: Analyze this ACTUAL website content thoroughly. Extract REAL informat
                         pass
 
             # Strategy 4: Parse embedded JSON within text using improved regex
-            import re
-            # More flexible regex pattern that handles nested JSON structures better
-            json_pattern = r'\{(?:[^{}]|(?:\{(?:[^{}]|\{[^{}]*\})*\}))*\}'
-
-            try:
-                json_matches = re.findall(json_pattern, analysis_text, re.DOTALL)
-
-                for match in json_matches:
-                    try:
-                        # Try to parse each potential JSON object found
-                        potential_json = json.loads(match)
-                        if isinstance(potential_json, dict) and len(potential_json) > 3:
-                            self._add_metadata(potential_json, url)
-                            return potential_json
-                    except json.JSONDecodeError:
-                        continue
-            except re.error as e:
-                # If regex fails, skip this strategy
-                print(f"Regex pattern error: {e}")
-                pass
+            # Matches are scanned lazily so the first usable object wins
+            for match in _EMBEDDED_JSON_RE.finditer(analysis_text):
+                try:
+                    # Try to parse each potential JSON object found
+                    potential_json = json.loads(match.group(0))
+                    if isinstance(potential_json, dict) and len(potential_json) > 3:
+                        self._add_metadata(potential_json, url)
+                        return potential_json
+                except json.JSONDecodeError:
+                    continue
 
             # Strategy 5: Extract JSON from explanatory text
             lines = analysis_text.split('\n')
@@ -532,13 +514,11 @@ IMPORTANT: Analyze this ACTUAL website content thoroughly. Extract REAL informat
 
     def analyze_image_with_text(self, image_path: str, prompt: str, **kwargs) -> str:
         """Analyze image with text prompt using Claude Vision."""
+        # Pillow is only needed here, so text-only runs skip importing it
+        from PIL import Image
+
         try:
             # Read and possibly compress image
-            import base64
-            import mimetypes
-            from PIL import Image
-            import io
-            import time
 
             # Check image dimensions and compress if needed (Claude has 8000px max dimension limit)
             file_size = os.path.getsize(image_path)
@@ -576,8 +556,7 @@ IMPORTANT: Analyze this ACTUAL website content thoroughly. Extract REAL informat
                     print(f"Compressed image size: {len(image_data)} bytes")
                 else:
                     # Use original image
-                    with open(image_path, "rb") as image_file:
-                        image_data = image_file.read()
+                    image_data = Path(image_path).read_bytes()
 
                     # Detect image format
                     mime_type = mimetypes.guess_type(image_path)[0]
@@ -629,8 +608,7 @@ IMPORTANT: Analyze this ACTUAL website content thoroughly. Extract REAL informat
             raise ValueError("No text found in Claude response")
 
         except Exception as e:
-            print(f"Error analyzing image with Claude: {e}")
-            print(f"Error details: {type(e).__name__}: {str(e)}")
+            print(f"Error analyzing image with Claude: {type(e).__name__}: {e}")
             # Also print the response if available for debugging
             if hasattr(e, 'response') and hasattr(e.response, 'text'):
                 print(f"API Response: {e.response.text[:500]}")
@@ -1,12 +1,17 @@
 """Gemini AI provider implementation."""
 
-import requests
 import json
 import os
 import base64
 from typing import Dict, Any, List
+from pathlib import Path
 from .base_provider import BaseAIProvider, AICapability
 
+# Minimal valid PNG (1x1 transparent) returned when image generation fails
+FALLBACK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
 class GeminiProvider(BaseAIProvider):
     """Gemini AI provider for text and image generation."""
     
@@ -15,6 +20,11 @@ class GeminiProvider(BaseAIProvider):
         self.api_key = self._get_api_key()
         self.text_endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
         self.image_endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+        # Request headers are identical for every call; build them once
+        self.headers = {
+            "x-goog-api-key": self.api_key,
+            "Content-Type": "application/json"
+        }
     
     def _get_api_key(self) -> str:
         """Get Gemini API key from environment."""
@@ -37,11 +47,6 @@ class GeminiProvider(BaseAIProvider):
     
     def _make_request(self, prompt: str, endpoint: str = None, **kwargs) -> Dict[str, Any]:
         """Make request to Gemini API."""
-        headers = {
-            "x-goog-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "contents": [
                 {
@@ -57,7 +62,7 @@ class GeminiProvider(BaseAIProvider):
         # Use provided endpoint or default to text endpoint
         url = endpoint or self.text_endpoint
         
-        response = requests.post(url, headers=headers, json=payload)
+        response = self.session.post(url, headers=self.headers, json=payload)
         response.raise_for_status()
         
         return response.json()
@@ -123,31 +128,19 @@ class GeminiProvider(BaseAIProvider):
             return decoded_data
             
         except Exception as e:
-            print(f"Error generating image with Gemini: {e}")
-            print(f"Full error details: {type(e).__name__}: {str(e)}")
+            print(f"Error generating image with Gemini: {type(e).__name__}: {e}")
             
             # Return a minimal valid PNG as fallback
-            # This is a 1x1 transparent PNG
-            fallback_png = base64.b64decode(
-                "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
-            )
-            print(f"Returning fallback PNG, size: {len(fallback_png)} bytes")
-            return fallback_png
+            return FALLBACK_PNG
 
     def analyze_image_with_text(self, image_path: str, prompt: str, **kwargs) -> str:
         """Analyze image with text prompt using Gemini Vision."""
         try:
             # Read and encode image
-            with open(image_path, "rb") as image_file:
-                image_data = image_file.read()
-                image_base64 = base64.b64encode(image_data).decode('utf-8')
+            image_data = Path(image_path).read_bytes()
+            image_base64 = base64.b64encode(image_data).decode('utf-8')
 
             # Prepare request for image analysis
-            headers = {
-                "x-goog-api-key": self.api_key,
-                "Content-Type": "application/json"
-            }
-
             payload = {
                 "contents": [
                     {
@@ -167,7 +160,7 @@ class GeminiProvider(BaseAIProvider):
             }
 
             # Make request to Gemini Vision API
-            response = requests.post(self.image_endpoint, headers=headers, json=payload)
+            response = self.session.post(self.image_endpoint, headers=self.headers, json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -1,6 +1,5 @@
 """OpenAI provider implementation."""
 
-import requests
 import json
 import os
 import base64
@@ -14,6 +13,11 @@ class OpenAIProvider(BaseAIProvider):
         super().__init__("openai", model)
         self.api_key = self._get_api_key()
         self.base_url = "https://api.openai.com/v1"
+        # Request headers are identical for every call; build them once
+        self.headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}"
+        }
     
     def _get_api_key(self) -> str:
         """Get OpenAI API key from environment."""
@@ -34,18 +38,13 @@ class OpenAIProvider(BaseAIProvider):
     
     def _make_chat_request(self, messages: List[Dict], **kwargs) -> Dict[str, Any]:
         """Make chat completion request to OpenAI API."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
         payload = {
             "model": self.model,
             "messages": messages,
             "max_tokens": kwargs.get("max_tokens", 4000)
         }
         
-        response = requests.post(f"{self.base_url}/chat/completions", headers=headers, json=payload)
+        response = self.session.post(f"{self.base_url}/chat/completions", headers=self.headers, json=payload)
         response.raise_for_status()
         
         return response.json()
@@ -76,11 +75,6 @@ class OpenAIProvider(BaseAIProvider):
     
     def generate_image(self, prompt: str, **kwargs) -> bytes:
         """Generate image with DALL-E."""
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
-        }
-        
         payload = {
             "model": "dall-e-3",
             "prompt": prompt,
@@ -89,7 +83,7 @@ class OpenAIProvider(BaseAIProvider):
             "response_format": "b64_json"
         }
         
-        response = requests.post(f"{self.base_url}/images/generations", headers=headers, json=payload)
+        response = self.session.post(f"{self.base_url}/images/generations", headers=self.headers, json=payload)
         response.raise_for_status()
         
         result = response.json()
@@ -1,7 +1,7 @@
 """Main orchestrator for running the complete brand workflow."""
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 from agents.base_agent import BaseAgent
@@ -15,14 +15,19 @@ from agents.facebook_scraper import FacebookScraper
 class BrandWorkflowOrchestrator(BaseAgent):
     """Orchestrates the complete brand analysis and content creation workflow."""
 
-    def __init__(self):
+    def __init__(self, ai_providers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            ai_providers: Optional provider name per capability (e.g. {"web_analysis": "openai"}).
+                Capabilities not listed fall back to the AI_*_PROVIDER environment settings.
+        """
         super().__init__("brand_workflow_orchestrator", "metrics")
 
         # Initialize all agents
-        self.business_analyzer = BusinessIntelligenceAnalyzer()
-        self.screenshot_analyzer = ScreenshotAnalyzer()
-        self.content_creator = SocialContentCreator()
-        self.prompt_generator = InstagramPromptGenerator()
+        self.business_analyzer = BusinessIntelligenceAnalyzer(ai_providers)
+        self.screenshot_analyzer = ScreenshotAnalyzer(ai_providers)
+        self.content_creator = SocialContentCreator(ai_providers)
+        self.prompt_generator = InstagramPromptGenerator(ai_providers)
         self.image_generator = BrandImageGenerator()
         self.facebook_scraper = FacebookScraper()
 
@@ -14,12 +14,11 @@ class Config:
         """Load environment variables from .env file."""
         env_file = Path('.env')
         if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key] = value
+            entries = (line.strip().partition('=') for line in env_file.read_text(encoding='utf-8').splitlines())
+            os.environ.update({
+                key: value for key, sep, value in entries
+                if sep and key and not key.startswith('#')
+            })
     
     @property
     def ai_providers(self) -> Dict[str, str]:
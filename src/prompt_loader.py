@@ -0,0 +1,34 @@
+"""Shared loader for the markdown prompt files in .claude/agents."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+def read_prompt(agent_name: str, prompts_dir: str = ".claude/agents") -> Optional[str]:
+    """
+    Read a prompt markdown file with its YAML front matter removed.
+
+    Returns None if the file does not exist. Missing files are checked on
+    every call, so a prompt added later is still picked up.
+    """
+    prompt_file = (Path(prompts_dir) / f"{agent_name}.md").resolve()
+    if not prompt_file.exists():
+        return None
+    return _read_prompt_file(str(prompt_file))
+
+@lru_cache(maxsize=64)
+def _read_prompt_file(path: str) -> str:
+    """Read and strip one prompt file, keyed by absolute path.
+
+    Prompt files ship with the code, so each one is read at most once per
+    process.
+    """
+    content = Path(path).read_text(encoding='utf-8')
+
+    # Remove YAML front matter if present (everything between --- lines)
+    if content.startswith('---'):
+        parts = content.split('---', 2)
+        if len(parts) >= 3:
+            content = parts[2].strip()
+
+    return content